@@ -1,12 +1,17 @@
+import asyncio
 import json
 import logging
 import re
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from datetime import date, datetime, timezone, timedelta
+from typing import TYPE_CHECKING, Callable, List, Dict, Any, Optional, Tuple
 
-from agents import Agent, Runner, WebSearchTool
+if TYPE_CHECKING:
+    from agents import Agent
+
+from . import fastjson, llm_cache
 
 # Configure logging
 logging.basicConfig(
@@ -21,7 +26,7 @@ logger = logging.getLogger(__name__)
 # Data models
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class DigestItem:
     title: str
     published_date: str
@@ -31,8 +36,20 @@ class DigestItem:
     publisher: str
     quality: Optional[Dict[str, str]] = None
 
-
-@dataclass
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert DigestItem to a plain dictionary."""
+        return {
+            "title": self.title,
+            "published_date": self.published_date,
+            "url": self.url,
+            "summary": self.summary,
+            "source_type": self.source_type,
+            "publisher": self.publisher,
+            "quality": dict(self.quality) if self.quality is not None else None,
+        }
+
+
+@dataclass(slots=True)
 class DigestSection:
     name: str
     query: str
@@ -40,7 +57,7 @@ class DigestSection:
     dropped_items: List[DigestItem] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DigestResult:
     date_utc: str
     top_themes: List[str]
@@ -48,9 +65,24 @@ class DigestResult:
     duration_seconds: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert DigestResult to a dictionary for JSON serialization."""
-        from dataclasses import asdict
-        return asdict(self)
+        """Convert DigestResult to a dictionary for JSON serialization.
+
+        Built by hand rather than with dataclasses.asdict, which deep-copies every field.
+        """
+        return {
+            "date_utc": self.date_utc,
+            "top_themes": list(self.top_themes),
+            "sections": [
+                {
+                    "name": s.name,
+                    "query": s.query,
+                    "items": [it.to_dict() for it in s.items],
+                    "dropped_items": [it.to_dict() for it in s.dropped_items],
+                }
+                for s in self.sections
+            ],
+            "duration_seconds": self.duration_seconds,
+        }
 
 
 # -----------------------------
@@ -71,7 +103,18 @@ It does NOT include:
 - Ordinary embeddings or vector databases unless explicitly HDC/VSA
 """
 
-def build_agent() -> Agent:
+# Upper bound for a single agent round trip, so one hung call cannot stall the whole digest
+AGENT_CALL_TIMEOUT_SECONDS = 120.0
+
+@lru_cache(maxsize=1)
+def build_agent() -> "Agent":
+    """Return the shared digest agent (built once per process; prompts are passed per call).
+
+    Callers must not mutate the returned agent; use ``agent.clone(...)`` for variants.
+    """
+    # Imported lazily: the agents SDK is heavy, and store/query/emailer only need the dataclasses
+    from agents import Agent, WebSearchTool
+
     return Agent(
         name="HDC Digest Agent",
         instructions=SYSTEM_PROMPT,
@@ -80,223 +123,93 @@ def build_agent() -> Agent:
     )
 
 
+async def _cached_run(agent: "Agent", prompt: str) -> Dict[str, Any]:
+    """Run the agent on prompt and return the parsed JSON, reusing a cached response if present.
+
+    Both the raw output and the parsed dict are cached so hits skip the LLM call and re-parsing.
+    Raises asyncio.TimeoutError if the agent does not answer within AGENT_CALL_TIMEOUT_SECONDS.
+    """
+    key = llm_cache.cache_key(str(agent.model), str(agent.instructions), prompt)
+    cached = llm_cache.get(key)
+    if cached is not None and cached.get("parsed") is not None:
+        logger.info("♻️  LLM cache hit")
+        return cached["parsed"]
+
+    from agents import Runner
+
+    result = await asyncio.wait_for(Runner.run(agent, prompt), timeout=AGENT_CALL_TIMEOUT_SECONDS)
+    parsed = _extract_json(result.final_output)
+    llm_cache.set(key, {"final_output": result.final_output, "parsed": parsed})
+    return parsed
+
+
 # -----------------------------
 # JSON extraction helper
 # -----------------------------
 
-def _fix_json_string(json_str: str) -> str:
+_DECODER = json.JSONDecoder()
+# Bound on '{' offsets tried by _extract_json, so pathological output cannot go quadratic
+_MAX_JSON_CANDIDATES = 16
+# A string literal whose interior quotes are only closing when followed by one of , : } ]
+_LOOSE_STRING_RE = re.compile(r'"((?:[^"\\]|\\.|"(?!\s*[,:}\]]))*)"', re.DOTALL)
+_STRING_ESCAPE_OR_QUOTE_RE = re.compile(r'(\\.)|"', re.DOTALL)
+
+
+def _escape_inner_quotes(match: "re.Match[str]") -> str:
+    body = _STRING_ESCAPE_OR_QUOTE_RE.sub(lambda m: m.group(1) or '\\"', match.group(1))
+    return f'"{body}"'
+
+
+def _repair_json(json_str: str) -> str:
     """
-    Attempt to fix common JSON issues like unescaped quotes in string values.
-    This is a best-effort fix for malformed JSON from agents.
+    Escape unescaped double quotes inside string values.
+    This is a best-effort fix for malformed JSON from agents: a quote inside a string
+    only closes it when the next non-whitespace character is one of , : } ]
     """
-    # Try to fix unescaped quotes in string values
-    # This is a simple heuristic - look for patterns like "text"text" and escape the inner quotes
-    import re
-    
-    # Pattern to find string values: "value"
-    # We want to escape quotes that are inside the value but not the delimiters
-    def escape_inner_quotes(match):
-        full_match = match.group(0)
-        # Skip if it's already escaped or if it's a key (has : after it)
-        if '\\"' in full_match:
-            return full_match
-        # Check if this looks like a value (not a key)
-        # Keys are followed by :, values are followed by , or } or ]
-        return full_match
-    
-    # More aggressive: try to find and fix unescaped quotes in JSON string values
-    # This is tricky, so we'll use a simpler approach: try parsing with different strategies
-    
-    return json_str
+    return _LOOSE_STRING_RE.sub(_escape_inner_quotes, json_str)
 
 
 def _extract_json(text: str) -> Dict[str, Any]:
     """
     Extract JSON from agent output, handling markdown code blocks and other formatting.
+
+    Tries a fast full-document parse first, then decodes the first JSON object found at
+    successive '{' offsets (trailing text is ignored). The quote-repair pass runs at most
+    once, on the first candidate.
     """
-    original_text = text
-    text = text.strip()
-    
-    # First, try to parse directly
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError as e:
-        logger.debug(f"Direct parse failed: {e}")
-        # Try raw_decode which handles trailing content
+    stripped = text.strip()
+    if stripped.startswith("```"):
+        # Fenced output is the only case that needs a second pass
+        stripped = stripped.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    # O(1) prefix/suffix check: only attempt a full-document parse when it can succeed
+    if stripped.startswith('{') and stripped.endswith('}'):
         try:
-            decoder = json.JSONDecoder()
-            parsed, idx = decoder.raw_decode(text)
-            logger.debug(f"Direct parse succeeded with raw_decode")
-            return parsed
+            return fastjson.loads(stripped)
         except json.JSONDecodeError:
             pass
-        # Try to fix common issues and parse again
+    start = stripped.find('{')
+    for attempt in range(_MAX_JSON_CANDIDATES):
+        if start == -1:
+            break
         try:
-            # Remove any trailing content after the last }
-            last_brace = text.rfind('}')
-            if last_brace != -1:
-                cleaned = text[:last_brace + 1]
-                return json.loads(cleaned)
-        except json.JSONDecodeError:
-            pass
-    
-    # Try to extract JSON from markdown code blocks
-    # Match ```json or ``` followed by JSON content
-    json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    if matches:
-        # For nested JSON, we need to find the matching braces
-        for match_start in re.finditer(r'```(?:json)?\s*\{', text, re.DOTALL):
-            # Find the matching closing brace
-            start_pos = match_start.end() - 1  # Position of the opening {
-            brace_count = 0
-            i = start_pos
-            while i < len(text):
-                if text[i] == '{':
-                    brace_count += 1
-                elif text[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        # Found matching closing brace
-                        json_str = text[start_pos:i + 1]
-                        try:
-                            return json.loads(json_str)
-                        except json.JSONDecodeError as e:
-                            logger.debug(f"Markdown block parse failed: {e}")
-                            break
-                i += 1
-    
-    # Try to find JSON object boundaries by matching braces
-    # Look for first { and find its matching }
-    start_idx = text.find('{')
-    if start_idx != -1:
-        brace_count = 0
-        for i in range(start_idx, len(text)):
-            if text[i] == '{':
-                brace_count += 1
-            elif text[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    json_str = text[start_idx:i + 1]
-                    # Clean up the JSON string - remove any trailing content
-                    json_str = json_str.strip()
-                    try:
-                        # Try using raw_decode which can handle trailing content
-                        decoder = json.JSONDecoder()
-                        parsed, idx = decoder.raw_decode(json_str)
-                        logger.debug(f"Successfully extracted JSON using brace matching with raw_decode")
-                        return parsed
-                    except json.JSONDecodeError as e:
-                        logger.debug(f"raw_decode failed: {e}")
-                        # If raw_decode fails, try regular loads
-                        try:
-                            parsed = json.loads(json_str)
-                            logger.debug(f"Successfully extracted JSON using brace matching")
-                            return parsed
-                        except json.JSONDecodeError as e2:
-                            logger.debug(f"Brace matching parse failed: {e2}, JSON string length: {len(json_str)}")
-                            logger.debug(f"Problematic JSON (first 500 chars): {json_str[:500]}")
-                            
-                            # The issue is likely unescaped quotes. Let's try a simple fix:
-                            # Replace unescaped quotes inside string values with escaped quotes
-                            # This is a heuristic - look for : "text"text" pattern
-                            try:
-                                # Simple approach: find string values and escape quotes that aren't already escaped
-                                # Pattern: find "..." that contains unescaped "
-                                # We'll use a state-based approach: track if we're inside a string
-                                fixed_chars = []
-                                in_string = False
-                                escape_next = False
-                                i = 0
-                                while i < len(json_str):
-                                    char = json_str[i]
-                                    if escape_next:
-                                        fixed_chars.append(char)
-                                        escape_next = False
-                                    elif char == '\\' and in_string:
-                                        fixed_chars.append(char)
-                                        escape_next = True
-                                    elif char == '"':
-                                        if in_string:
-                                            # Check if this closes the string (next char is , : } ] or whitespace)
-                                            peek_ahead = json_str[i+1:].lstrip()
-                                            if peek_ahead and peek_ahead[0] in ',:}]':
-                                                # This is a closing quote
-                                                fixed_chars.append(char)
-                                                in_string = False
-                                            else:
-                                                # This might be an unescaped quote inside the string
-                                                fixed_chars.append('\\"')
-                                        else:
-                                            # Opening quote
-                                            fixed_chars.append(char)
-                                            in_string = True
-                                    else:
-                                        fixed_chars.append(char)
-                                    i += 1
-                                
-                                fixed = ''.join(fixed_chars)
-                                parsed = json.loads(fixed)
-                                logger.debug(f"Successfully extracted JSON after fixing quotes")
-                                return parsed
-                            except (json.JSONDecodeError, ValueError, IndexError) as fix_error:
-                                logger.debug(f"Quote fixing also failed: {fix_error}")
-                                pass
-                        
-                        # Try to find if there's a valid JSON substring
-                        # Sometimes there's trailing text that breaks parsing
-                        # Try parsing progressively shorter strings
-                        for end_offset in range(1, min(50, len(json_str))):
-                            try:
-                                shorter = json_str[:-end_offset].rstrip()
-                                # Make sure it ends with }
-                                if shorter.endswith('}'):
-                                    parsed = json.loads(shorter)
-                                    logger.debug(f"Successfully extracted JSON by trimming {end_offset} chars")
-                                    return parsed
-                            except (json.JSONDecodeError, ValueError):
-                                continue
-                        # Section-style JSON with extra "note" key: extract up to end of "items": []
-                        if '"items":' in json_str:
-                            items_start = json_str.find('"items":')
-                            bracket_open = json_str.find('[', items_start)
-                            if bracket_open != -1:
-                                depth = 1
-                                i = bracket_open + 1
-                                while i < len(json_str) and depth > 0:
-                                    if json_str[i] == '[':
-                                        depth += 1
-                                    elif json_str[i] == ']':
-                                        depth -= 1
-                                    i += 1
-                                if depth == 0:
-                                    end_items = i - 1
-                                    truncated = json_str[: end_items + 1] + '}'
-                                    try:
-                                        parsed = json.loads(truncated)
-                                        logger.debug("Successfully extracted JSON by truncating after items array")
-                                        return parsed
-                                    except json.JSONDecodeError:
-                                        pass
-                        break
-    
-    # Last resort: try to find and extract any JSON-like structure
-    # Look for patterns like {"name": ...}
-    json_obj_pattern = r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}'
-    matches = re.findall(json_obj_pattern, text, re.DOTALL)
-    for match in matches:
-        try:
-            parsed = json.loads(match)
-            logger.debug(f"Successfully extracted JSON using regex pattern matching")
-            return parsed
-        except json.JSONDecodeError:
-            continue
-    
-    # If all else fails, raise with helpful error message
-    logger.error(f"Failed to extract JSON. Full text length: {len(original_text)}")
-    logger.error(f"First 1000 chars: {repr(original_text[:1000])}")
+            return _DECODER.raw_decode(stripped, start)[0]
+        except json.JSONDecodeError as e:
+            logger.debug("raw_decode at offset %d failed: %s", start, e)
+        if attempt == 0:
+            # Malformed quotes are far more common than prose containing braces, so repair
+            # the first candidate before trying later '{' offsets
+            try:
+                parsed = _DECODER.raw_decode(_repair_json(stripped[start:]))[0]
+                logger.debug("Successfully extracted JSON after fixing quotes")
+                return parsed
+            except json.JSONDecodeError as e:
+                logger.debug("Quote fixing also failed: %s", e)
+        start = stripped.find('{', start + 1)
+
+    logger.error(f"Failed to extract JSON. Full text length: {len(text)}")
+    logger.error(f"First 1000 chars: {repr(text[:1000])}")
     raise ValueError(
-        f"Could not extract valid JSON from agent output. First 500 chars: {original_text[:500]}"
+        f"Could not extract valid JSON from agent output. First 500 chars: {text[:500]}"
     )
 
 
@@ -304,6 +217,20 @@ def _extract_json(text: str) -> Dict[str, Any]:
 # Date filtering
 # -----------------------------
 
+@lru_cache(maxsize=1024)
+def _parse_iso_date(s: str) -> Optional[datetime]:
+    """Parse the YYYY-MM-DD prefix of s via the C fast path; memoized since dates repeat across items."""
+    try:
+        return datetime.combine(date.fromisoformat(s[:10]), datetime.min.time(), tzinfo=timezone.utc)
+    except ValueError:
+        pass
+    # fromisoformat is strict on 3.10; strptime also accepts unpadded dates like 2024-1-5
+    try:
+        return datetime.strptime(s[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
 def _parse_date(s: Optional[str]) -> Optional[datetime]:
     """Parse YYYY-MM-DD to date; return None if missing or invalid."""
     if not s or not isinstance(s, str):
@@ -311,81 +238,62 @@ def _parse_date(s: Optional[str]) -> Optional[datetime]:
     s = s.strip()
     if not s:
         return None
-    try:
-        return datetime.strptime(s[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc)
-    except ValueError:
-        return None
+    return _parse_iso_date(s)
 
 
-def _is_within_days_back(published_date_str: Optional[str], days_back: int) -> bool:
-    """True if no date, or parsed date is within the last days_back days (inclusive of today)."""
+def _make_date_filter(days_back: int) -> Callable[[Optional[str]], bool]:
+    """Return a predicate: True if no date, or parsed date is within the last days_back days
+    (inclusive of today). The cutoff is computed once, not per item."""
     if days_back <= 0:
-        return True
-    d = _parse_date(published_date_str)
-    if d is None:
-        return True  # keep items with unknown date
-    today = datetime.now(timezone.utc).date()
-    cutoff = today - timedelta(days=days_back)
-    return d.date() >= cutoff
+        return lambda published_date_str: True
+    cutoff = datetime.now(timezone.utc).date() - timedelta(days=days_back)
+
+    def _is_within_days_back(published_date_str: Optional[str]) -> bool:
+        d = _parse_date(published_date_str)
+        if d is None:
+            return True  # keep items with unknown date
+        return d.date() >= cutoff
+
+    return _is_within_days_back
 
 
 # -----------------------------
 # Field normalization
 # -----------------------------
 
-def _normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+def _item_from_raw(item: Dict[str, Any]) -> DigestItem:
     """
-    Normalize item dictionary to match DigestItem field names.
-    Handles field name variations from agent output.
+    Build a DigestItem from an agent item dictionary in a single pass.
+    Handles field name variations from agent output ('type' -> 'source_type'),
+    ignores extra fields, and defaults missing fields to empty strings.
     """
-    normalized = item.copy()
-    
-    # Map 'type' to 'source_type' if present
-    if 'type' in normalized and 'source_type' not in normalized:
-        normalized['source_type'] = normalized.pop('type')
-        logger.debug(f"Mapped 'type' -> 'source_type' for item: {normalized.get('title', 'unknown')}")
-    
-    # Remove any extra fields that aren't part of DigestItem
-    allowed_fields = {'title', 'published_date', 'url', 'summary', 'source_type', 'publisher', 'quality'}
-    normalized = {k: v for k, v in normalized.items() if k in allowed_fields}
-    
-    # Ensure all required fields exist with defaults if missing
-    required_fields = {
-        'title': '',
-        'published_date': '',
-        'url': '',
-        'summary': '',
-        'source_type': '',
-        'publisher': '',
-    }
-    
-    for field, default in required_fields.items():
-        if field not in normalized:
-            normalized[field] = default
-    
-    return normalized
+    return DigestItem(
+        title=item.get("title", ""),
+        published_date=item.get("published_date", ""),
+        url=item.get("url", ""),
+        summary=item.get("summary", ""),
+        source_type=item["source_type"] if "source_type" in item else item.get("type", ""),
+        publisher=item.get("publisher", ""),
+        quality=item.get("quality"),
+    )
 
 
 # -----------------------------
 # Section search
 # -----------------------------
 
-def _run_section(agent: Agent, name: str, query: str, days_back: int, max_items: int) -> Dict[str, Any]:
-    logger.info(f"🔍 Searching section: {name}")
-    logger.info(f"   Query: {query}")
-    
-    # Calculate explicit date range for better search precision
-    today = datetime.now(timezone.utc).date()
-    start_date = today - timedelta(days=days_back - 1)  # Include today in the range
-    end_date = today
-    
-    # Papers: instruct agent to also use Google Scholar and arXiv
-    search_instruction = (
-        "Run a web search and also search Google Scholar (https://scholar.google.com) and arXiv (https://arxiv.org) for academic papers. "
-        if name == "Papers" else "Run a web search for the query below. "
-    )
+SECTION_QUERIES = {
+    "Papers": '("hyperdimensional computing" OR hypervector OR "vector symbolic") (paper OR arxiv)',
+    "News": '("hyperdimensional computing" OR hypervector OR "vector symbolic") news',
+    "Blogs": '("hyperdimensional computing" OR hypervector OR binding bundling) blog'
+}
 
-    prompt = f"""
+SECTION_SOURCE_TYPES = {"Papers": "paper", "News": "news", "Blogs": "blog"}
+
+# Two-stage template: section-specific fields are filled once at import time, leaving
+# {days_back}, {max_items}, {start_date} and {end_date} for each run. Literal JSON braces
+# are quadrupled so they survive both .format() passes.
+_SECTION_PROMPT_BASE = """
 SECTION: {name}
 
 {search_instruction}
@@ -394,32 +302,91 @@ QUERY:
 {query}
 
 Return ONLY valid JSON:
-{{
+{{{{
   "name": "{name}",
   "query": "{query}",
   "items": [
-    {{
+    {{{{
       "title": "exact title of the item",
       "published_date": "YYYY-MM-DD or empty string if unknown",
       "url": "full URL to the item (required; use the actual link from search results)",
       "summary": "2–4 factual sentences describing the content (required for every item)",
-      "source_type": "{'paper' if name=='Papers' else ('news' if name=='News' else 'blog')}",
-      "publisher": "publisher/site name or empty"
-    }}
+      "source_type": "{source_type}",
+      "publisher": "publisher/site name or empty",
+      "quality": {{{{
+        "verdict": "KEEP|DROP",
+        "confidence": "high|medium|low",
+        "reason": "one short sentence"
+      }}}}
+    }}}}
   ]
-}}
+}}}}
 
 Rules:
-- Include only items published or posted within the last {days_back} days ({start_date.isoformat()} to {end_date.isoformat()}). If the publish date is unknown, you may include the item (leave published_date empty); if the date is known and older than this window, do not include it.
-- Max {max_items} items
+- Include only items published or posted within the last {{days_back}} days ({{start_date}} to {{end_date}}). If the publish date is unknown, you may include the item (leave published_date empty); if the date is known and older than this window, do not include it.
+- Max {{max_items}} items
 - Drop weak or tangential matches
 - For every item you must provide: title, url (the real link), and summary. published_date and publisher can be empty if unknown.
+- Verify each item is truly about Hyperdimensional Computing (HDC) / VSA / hypervectors and set quality.verdict: KEEP if clearly HDC/VSA, DROP otherwise.
 - Return only the JSON object with keys name, query, items. Do not add "note" or any other keys.
 - JSON only
 """
+
+
+def _search_instruction(name: str) -> str:
+    """Papers: instruct agent to also use Google Scholar and arXiv."""
+    return (
+        "Run a web search and also search Google Scholar (https://scholar.google.com) and arXiv (https://arxiv.org) for academic papers. "
+        if name == "Papers" else "Run a web search for the query below. "
+    )
+
+
+def _escape_braces(text: str) -> str:
+    """Double braces so text stays literal through the per-run .format() pass."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _build_section_template(name: str, query: str) -> str:
+    """Fill the section-specific parts of the search prompt."""
+    return _SECTION_PROMPT_BASE.format(
+        name=_escape_braces(name),
+        query=_escape_braces(query),
+        search_instruction=_search_instruction(name),
+        source_type=_escape_braces(SECTION_SOURCE_TYPES.get(name, "blog")),
+    )
+
+
+# Keyed by (name, query): a caller passing its own query for a known section gets its own template
+_SECTION_PROMPT_TEMPLATES = {
+    (name, query): _build_section_template(name, query) for name, query in SECTION_QUERIES.items()
+}
+
+
+async def _run_section_async(agent: "Agent", name: str, query: str, days_back: int, max_items: int) -> Dict[str, Any]:
+    logger.info(f"🔍 Searching section: {name}")
+    logger.info(f"   Query: {query}")
+    
+    # Calculate explicit date range for better search precision
+    today = datetime.now(timezone.utc).date()
+    start_date = today - timedelta(days=days_back - 1)  # Include today in the range
+    end_date = today
+
+    template = _SECTION_PROMPT_TEMPLATES.get((name, query)) or _build_section_template(name, query)
+    prompt = template.format(
+        days_back=days_back,
+        max_items=max_items,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+    )
     section_start = time.time()
-    result = Runner.run_sync(agent, prompt)
-    section_data = _extract_json(result.final_output)
+    try:
+        section_data = await _cached_run(agent, prompt)
+    except asyncio.TimeoutError:
+        logger.warning(f"⏱️  Section {name} timed out after {AGENT_CALL_TIMEOUT_SECONDS:.0f}s; continuing with no items")
+        section_data = {"items": []}
+    # The batched quality gate matches sections by name, so pin name/query to what we asked for
+    section_data["name"] = name
+    section_data["query"] = query
     section_duration = time.time() - section_start
     
     item_count = len(section_data.get("items", []))
@@ -428,82 +395,234 @@ Rules:
     return section_data
 
 
+async def _run_single_call_async(
+    agent: "Agent", days_back: int, max_items: int
+) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+    """Search, verify and summarize all sections in one LLM round trip.
+
+    Returns (sections, top_themes), or None if the response is unusable (malformed, or any
+    section missing or empty) so the caller can fall back to the per-section pipeline.
+    """
+    today = datetime.now(timezone.utc).date()
+    start_date = today - timedelta(days=days_back - 1)  # Include today in the range
+    section_blocks = "\n".join(
+        f"SECTION: {name}\nsource_type: {SECTION_SOURCE_TYPES.get(name, 'blog')}\n"
+        f"{_search_instruction(name)}\nQUERY:\n{query}\n"
+        for name, query in SECTION_QUERIES.items()
+    )
+    prompt = f"""
+Run one search per section below and return all results together.
+
+{section_blocks}
+Return ONLY valid JSON:
+{{
+  "top_themes": ["theme1", "theme2", "..."],
+  "sections": [
+    {{
+      "name": "(section name as given)",
+      "query": "(query as given)",
+      "items": [
+        {{
+          "title": "exact title of the item",
+          "published_date": "YYYY-MM-DD or empty string if unknown",
+          "url": "full URL to the item (required; use the actual link from search results)",
+          "summary": "2–4 factual sentences describing the content (required for every item)",
+          "source_type": "(source_type of the section)",
+          "publisher": "publisher/site name or empty",
+          "quality": {{
+            "verdict": "KEEP|DROP",
+            "confidence": "high|medium|low",
+            "reason": "one short sentence"
+          }}
+        }}
+      ]
+    }}
+  ]
+}}
+
+Rules:
+- Include only items published or posted within the last {days_back} days ({start_date.isoformat()} to {today.isoformat()}). If the publish date is unknown, you may include the item (leave published_date empty); if the date is known and older than this window, do not include it.
+- Max {max_items} items per section
+- Drop weak or tangential matches
+- For every item you must provide: title, url (the real link), and summary. published_date and publisher can be empty if unknown.
+- Verify each item is truly about Hyperdimensional Computing (HDC) / VSA / hypervectors and set quality.verdict: KEEP if clearly HDC/VSA, DROP otherwise.
+- top_themes summarizes the main themes across the KEEP items of all sections.
+- JSON only
+"""
+    logger.info(f"🔍 Searching all {len(SECTION_QUERIES)} sections in a single call")
+    call_start = time.time()
+    try:
+        combined = await _cached_run(agent, prompt)
+    except (asyncio.TimeoutError, ValueError) as e:
+        logger.warning(f"Single-call digest failed ({type(e).__name__}); falling back to per-section calls")
+        return None
+
+    by_name = {
+        s.get("name"): s for s in combined.get("sections", []) if isinstance(s, dict)
+    }
+    sections = []
+    for name, query in SECTION_QUERIES.items():
+        section = by_name.get(name)
+        if not section or not section.get("items"):
+            logger.warning(f"Single-call digest returned no items for {name}; falling back to per-section calls")
+            return None
+        sections.append({"name": name, "query": query, "items": section["items"]})
+    top_themes = combined.get("top_themes")
+    logger.info(f"✅ Single-call search completed in {time.time() - call_start:.2f}s")
+    return sections, top_themes if isinstance(top_themes, list) else []
+
+
+def _dedupe_across_sections(sections: List[Dict[str, Any]]) -> None:
+    """Drop items whose URL already appeared in an earlier section (in place), so each is gated once."""
+    from .store import normalize_url
+
+    seen: set = set()
+    removed = 0
+    for section in sections:
+        unique_items = []
+        for it in section.get("items", []):
+            key = normalize_url(it.get("url") or "")
+            if key and key in seen:
+                removed += 1
+                continue
+            if key:
+                seen.add(key)
+            unique_items.append(it)
+        section["items"] = unique_items
+    if removed:
+        logger.info(f"🧹 Removed {removed} cross-section duplicate(s) before quality gate")
+
+
 # -----------------------------
 # Quality gate
 # -----------------------------
 
-def _quality_gate_section(agent: Agent, section: Dict[str, Any]) -> Dict[str, Any]:
-    section_name = section.get("name", "Unknown")
-    initial_count = len(section.get("items", []))
-    logger.info(f"🔎 Quality gating section: {section_name} ({initial_count} items)")
-    
+def _has_verdict(item: Dict[str, Any]) -> bool:
+    """True if the item already carries a usable KEEP/DROP verdict."""
+    quality = item.get("quality")
+    verdict = quality.get("verdict") if isinstance(quality, dict) else None
+    return isinstance(verdict, str) and verdict.strip().upper() in ("KEEP", "DROP")
+
+
+def _split_by_verdict(section: Dict[str, Any], gated_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a gated section with kept and dropped items.
+
+    Normalize verdict (case-insensitive) so we never lose items: only explicit KEEP is
+    kept; everything else goes to dropped (for review).
+    """
+    kept_items = []
+    dropped_items = []
+    for it in gated_items:
+        verdict = (it.get("quality") or {}).get("verdict")
+        is_keep = (
+            isinstance(verdict, str)
+            and str(verdict).strip().upper() == "KEEP"
+        )
+        if is_keep:
+            kept_items.append(it)
+        else:
+            dropped_items.append(it)
+    return {
+        "name": section["name"],
+        "query": section["query"],
+        "items": kept_items,
+        "dropped_items": dropped_items,
+    }
+
+
+async def _quality_gate_sections_async(agent: "Agent", sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Quality gate all sections in a single LLM call, returning them in input order."""
+    to_gate = [s for s in sections if s.get("items")]
+    initial_count = sum(len(s["items"]) for s in to_gate)
+    logger.info(f"🔎 Quality gating {len(to_gate)} sections in one call ({initial_count} items)")
+    if not to_gate:
+        return [_split_by_verdict(s, []) for s in sections]
+
     prompt = f"""
-Verify each item is truly about Hyperdimensional Computing (HDC) / VSA / hypervectors.
+Verify each item in each section is truly about Hyperdimensional Computing (HDC) / VSA / hypervectors.
 
 Mark:
 - KEEP if clearly HDC/VSA
 - DROP otherwise
 
-Return ONLY JSON. You must preserve every item exactly as given (same title, url, summary, published_date, source_type, publisher) and only add the "quality" object to each item. Do not omit or shorten any field.
+Return ONLY JSON. Return every input section (same name and query, same order). You must preserve every item exactly as given (same title, url, summary, published_date, source_type, publisher) and only add the "quality" object to each item. Do not omit or shorten any field.
 
 {{
-  "name": "{section['name']}",
-  "query": "{section['query']}",
-  "items": [
+  "sections": [
     {{
-      "title": "(copy from input)",
-      "published_date": "(copy from input)",
-      "url": "(copy from input)",
-      "summary": "(copy from input)",
-      "source_type": "(copy from input)",
-      "publisher": "(copy from input)",
-      "quality": {{
-        "verdict": "KEEP|DROP",
-        "confidence": "high|medium|low",
-        "reason": "one short sentence"
-      }}
+      "name": "(copy from input)",
+      "query": "(copy from input)",
+      "items": [
+        {{
+          "title": "(copy from input)",
+          "published_date": "(copy from input)",
+          "url": "(copy from input)",
+          "summary": "(copy from input)",
+          "source_type": "(copy from input)",
+          "publisher": "(copy from input)",
+          "quality": {{
+            "verdict": "KEEP|DROP",
+            "confidence": "high|medium|low",
+            "reason": "one short sentence"
+          }}
+        }}
+      ]
     }}
   ]
 }}
 
 INPUT:
-{json.dumps(section)}
+{fastjson.dumps(to_gate)}
 """
     gate_start = time.time()
-    result = Runner.run_sync(agent, prompt)
-    gated = _extract_json(result.final_output)
+    try:
+        gated = await _cached_run(agent, prompt)
+    except asyncio.TimeoutError:
+        # Without verdicts every item lands in dropped (for review) rather than being lost
+        logger.warning(f"⏱️  Quality gate timed out after {AGENT_CALL_TIMEOUT_SECONDS:.0f}s; no items verified")
+        gated = {"sections": [{"name": s["name"], "items": s["items"]} for s in to_gate]}
     gate_duration = time.time() - gate_start
 
-    # Separate kept and dropped items. Normalize verdict (case-insensitive) so we never
-    # lose items: only explicit KEEP is kept; everything else goes to dropped (for review).
-    kept_items = []
-    dropped_items = []
-    for it in gated.get("items", []):
-        verdict = (it.get("quality") or {}).get("verdict")
-        is_keep = (
-            isinstance(verdict, str)
-            and str(verdict).strip().upper() == "KEEP"
+    gated_by_name = {
+        gs.get("name"): gs.get("items", [])
+        for gs in gated.get("sections", [])
+        if isinstance(gs, dict)
+    }
+    result = []
+    for section in sections:
+        if section.get("items") and section["name"] not in gated_by_name:
+            # Section missing from the gate output: keep its items for review rather than lose them
+            logger.warning(f"Quality gate omitted section {section['name']}; marking its items as dropped")
+        gated_items = gated_by_name.get(section["name"], section.get("items", []))
+        gated_section = _split_by_verdict(section, gated_items)
+        logger.info(
+            f"✅ Quality gate complete: {section['name']} "
+            f"({len(gated_section['items'])} kept, {len(gated_section['dropped_items'])} dropped)"
         )
-        if is_keep:
-            kept_items.append(it)
-        else:
-            dropped_items.append(it)
-    
-    gated["items"] = kept_items
-    gated["dropped_items"] = dropped_items
-    
-    kept_count = len(kept_items)
-    dropped_count = len(dropped_items)
-    logger.info(f"✅ Quality gate complete: {section_name} ({kept_count} kept, {dropped_count} dropped, {gate_duration:.2f}s)")
-    
-    return gated
+        result.append(gated_section)
+    logger.info(f"✅ Batched quality gate finished in {gate_duration:.2f}s")
+    return result
 
 
 # -----------------------------
 # Main digest
 # -----------------------------
 
-def run_digest(days_back: int = 1, max_items_per_section: int = 8) -> DigestResult:
+def run_digest(days_back: int = 1, max_items_per_section: int = 8, single_call: bool = False) -> DigestResult:
+    """Run the digest end to end (blocking wrapper around arun_digest)."""
+    return asyncio.run(arun_digest(days_back, max_items_per_section, single_call))
+
+
+async def arun_digest(
+    days_back: int = 1, max_items_per_section: int = 8, single_call: bool = False
+) -> DigestResult:
+    """Async digest core for callers that already run an event loop.
+
+    Sections are searched (and self-verified) concurrently; items still lacking a
+    verdict are gated in one batched call. With single_call=True, one prompt searches,
+    verifies and summarizes all sections, falling back to the per-section pipeline if
+    any section comes back empty or malformed.
+    """
     overall_start = time.time()
     logger.info("=" * 80)
     logger.info("🚀 Starting HDC Daily Digest generation")
@@ -514,66 +633,108 @@ def run_digest(days_back: int = 1, max_items_per_section: int = 8) -> DigestResu
     agent = build_agent()
     logger.info("✅ Agent built successfully")
 
-    queries = {
-        "Papers": '("hyperdimensional computing" OR hypervector OR "vector symbolic") (paper OR arxiv)',
-        "News": '("hyperdimensional computing" OR hypervector OR "vector symbolic") news',
-        "Blogs": '("hyperdimensional computing" OR hypervector OR binding bundling) blog'
-    }
+    queries = SECTION_QUERIES
+
+    raw: Optional[List[Dict[str, Any]]] = None
+    top_themes: Optional[List[str]] = None
+    if single_call:
+        combined = await _run_single_call_async(agent, days_back, max_items_per_section)
+        if combined is not None:
+            raw, top_themes = combined
+
+    if raw is None:
+        logger.info(f"📊 Running searches for {len(queries)} sections...")
+        search_start = time.time()
+        # Each section is an independent, I/O-bound LLM round trip: run them concurrently.
+        raw = await asyncio.gather(*[
+            _run_section_async(agent, name, q, days_back, max_items_per_section)
+            for name, q in queries.items()
+        ])
+        search_duration = time.time() - search_start
+        logger.info(f"✅ All searches completed in {search_duration:.2f}s")
+
+    # Drop out-of-window items before gating so they don't cost gate-prompt tokens
+    is_within_days_back = _make_date_filter(days_back)
+    for s in raw:
+        s["items"] = [
+            it for it in s.get("items", [])
+            if is_within_days_back(it.get("published_date"))
+        ]
+    _dedupe_across_sections(raw)
 
-    logger.info(f"📊 Running searches for {len(queries)} sections...")
-    search_start = time.time()
-    raw = [
-        _run_section(agent, name, q, days_back, max_items_per_section)
-        for name, q in queries.items()
+    # Search prompts ask the agent to verify items itself; only items that came back
+    # without a verdict pay for the separate quality-gate call.
+    unverified = [
+        {"name": s["name"], "query": s["query"], "items": [it for it in s["items"] if not _has_verdict(it)]}
+        for s in raw
     ]
-    search_duration = time.time() - search_start
-    logger.info(f"✅ All searches completed in {search_duration:.2f}s")
-
-    logger.info("🔎 Running quality gates...")
-    gated = [_quality_gate_section(agent, s) for s in raw]
-    logger.info("✅ All quality gates completed")
+    logger.info("🔎 Running quality gate for unverified items...")
+    gate_fallback = await _quality_gate_sections_async(agent, unverified)
+    gated = [
+        _split_by_verdict(
+            s,
+            [it for it in s["items"] if _has_verdict(it)] + g["items"] + g["dropped_items"],
+        )
+        for s, g in zip(raw, gate_fallback)
+    ]
+    for g in gated:
+        logger.info(f"   {g['name']}: {len(g['items'])} kept, {len(g['dropped_items'])} dropped")
+    logger.info("✅ Quality gate completed")
 
-    # Extract dropped items before synthesis (they don't need theme synthesis)
-    dropped_by_section = {s["name"]: s.get("dropped_items", []) for s in gated}
-    
-    # Prepare sections for synthesis (only kept items)
+    # Prepare sections for synthesis: only kept items, and only the fields theme synthesis
+    # needs (urls, publishers, dates and quality verdicts add tokens, not context)
     sections_for_synth = [
-        {k: v for k, v in s.items() if k != "dropped_items"}
+        {
+            "name": s.get("name"),
+            "items": [
+                {"title": it.get("title", ""), "summary": it.get("summary", "")}
+                for it in s.get("items", [])
+            ],
+        }
         for s in gated
     ]
-
-    logger.info("📝 Synthesizing themes...")
-    synth_start = time.time()
-    synth_prompt = f"""
+    total_kept = sum(len(s["items"]) for s in sections_for_synth)
+
+    if total_kept == 0:
+        # Nothing to summarize: skip the synthesis round trip entirely
+        logger.info("⏭️  No kept items in any section; skipping theme synthesis")
+        data = {"top_themes": []}
+    elif top_themes is not None:
+        # Themes already came back with the single-call search
+        data = {"top_themes": top_themes}
+    else:
+        logger.info("📝 Synthesizing themes...")
+        synth_start = time.time()
+        synth_prompt = f"""
 Summarize the main themes across the sections below.
 
-Return ONLY JSON with exactly these two keys (no other keys, no sections):
+Return ONLY JSON with exactly this key (no other keys, no sections):
 {{
-  "date_utc": "YYYY-MM-DD",
   "top_themes": ["theme1", "theme2", "..."]
 }}
 
 Sections (for context only; do not echo back):
-{json.dumps(sections_for_synth, default=str)}
+{fastjson.dumps(sections_for_synth)}
 """
-    synth = Runner.run_sync(agent, synth_prompt)
-    data = _extract_json(synth.final_output)
-    synth_duration = time.time() - synth_start
-    logger.info(f"✅ Theme synthesis completed in {synth_duration:.2f}s")
+        try:
+            data = await _cached_run(agent, synth_prompt)
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️  Theme synthesis timed out after {AGENT_CALL_TIMEOUT_SECONDS:.0f}s; no themes")
+            data = {}
+        synth_duration = time.time() - synth_start
+        logger.info(f"✅ Theme synthesis completed in {synth_duration:.2f}s")
 
     # Build sections from gated data so url, published_date, summary are preserved.
-    # Filter out items with published_date older than days_back (keep items with no date).
+    # Items were date-filtered before gating; filter again as a safety net in case the
+    # gate rewrote a published_date (keep items with no date).
     cutoff_date = (datetime.now(timezone.utc).date() - timedelta(days=days_back)).isoformat()
     logger.info(f"📅 Filtering items: only keep published_date >= {cutoff_date} or unknown")
     sections: List[DigestSection] = []
     for s in gated:
         section_name = s["name"]
-        kept_raw = [it for it in s.get("items", []) if _is_within_days_back(it.get("published_date"), days_back)]
-        items = [DigestItem(**_normalize_item(it)) for it in kept_raw]
-        dropped_items = [
-            DigestItem(**_normalize_item(it))
-            for it in s.get("dropped_items", [])
-        ]
+        kept_raw = [it for it in s.get("items", []) if is_within_days_back(it.get("published_date"))]
+        items = [_item_from_raw(it) for it in kept_raw]
+        dropped_items = [_item_from_raw(it) for it in s.get("dropped_items", [])]
         sections.append(DigestSection(section_name, s["query"], items, dropped_items))
 
     total_duration = time.time() - overall_start
@@ -587,7 +748,8 @@ Sections (for context only; do not echo back):
     logger.info("=" * 80)
 
     return DigestResult(
-        date_utc=data.get("date_utc", datetime.now(timezone.utc).date().isoformat()),
+        # The run date is known locally; no need to have the model echo it back
+        date_utc=datetime.now(timezone.utc).date().isoformat(),
         top_themes=data.get("top_themes", []),
         sections=sections,
         duration_seconds=total_duration,
@@ -1,16 +1,135 @@
 import os
+import random
+import re
 import sys
-import html
+import time
 import traceback
+import uuid
 from datetime import datetime, timezone
-from typing import cast
-import resend
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, TextIO, Tuple
 from .digest import DigestItem, DigestResult
 
 
+RESEND_API_URL = "https://api.resend.com"
+
+if TYPE_CHECKING:
+    import httpx
+
+_http_client: Optional["httpx.Client"] = None
+
+
+def _get_http_client() -> "httpx.Client":
+    """Return the shared, connection-pooled client for the Resend API (created on first use)."""
+    global _http_client
+    if _http_client is None:
+        # Imported lazily so rendering and previews don't pay for the HTTP stack
+        import httpx
+
+        _http_client = httpx.Client(base_url=RESEND_API_URL, timeout=30.0)
+    return _http_client
+
+
+@lru_cache(maxsize=1)
+def _email_settings() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Read (RESEND_API_KEY, EMAIL_FROM, EMAIL_TO) once; callers validate them when they send."""
+    return (
+        os.environ.get("RESEND_API_KEY"),
+        os.environ.get("EMAIL_FROM"),
+        os.environ.get("EMAIL_TO"),
+    )
+
+
+def _is_transient(error: Exception) -> bool:
+    """Timeouts, connection failures, 429 and 5xx are worth retrying; other 4xx are not."""
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _send_via_resend(
+    api_key: str,
+    params: Dict[str, Any],
+    max_attempts: int = 4,
+    base_delay: float = 0.25,
+    max_delay: float = 4.0,
+) -> None:
+    """POST an email to the Resend API, reusing the pooled TLS connection across sends.
+
+    Transient failures are retried with capped exponential backoff and jitter. One
+    Idempotency-Key is generated per call and reused on every attempt, so a retry after
+    a lost response cannot deliver the same email twice, while separate sends of an
+    identical payload are still delivered.
+    """
+    idempotency_key = uuid.uuid4().hex
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Idempotency-Key": idempotency_key,
+    }
+    client = _get_http_client()
+    for attempt in range(max_attempts):
+        try:
+            response = client.post("/emails", json=params, headers=headers)
+            response.raise_for_status()
+            return
+        except Exception as e:
+            if attempt == max_attempts - 1 or not _is_transient(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * (0.5 + random.random() / 2)
+            print(
+                f"WARNING: Resend send failed ({e}); retrying in {delay:.2f}s "
+                f"(attempt {attempt + 2}/{max_attempts})",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+
+try:
+    from markupsafe import escape as _markupsafe_escape
+except ImportError:  # optional speedup; install with `pip install -e .[fast]`
+    _markupsafe_escape = None
+
+_HTML_SPECIALS_RE = re.compile(r'[&<>"\']')
+# Same entities as html.escape(quote=True), applied in a single translate pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+@lru_cache(maxsize=2048)
 def _escape_html(text: str) -> str:
-    """Escape HTML entities to prevent XSS attacks."""
-    return html.escape(text)
+    """Escape HTML entities to prevent XSS attacks. Memoized: names and dates repeat across items."""
+    # Most fields contain no specials; skip the escape pass and copy entirely
+    if _HTML_SPECIALS_RE.search(text) is None:
+        return text
+    if _markupsafe_escape is not None:
+        # markupsafe's C scanner; it writes quotes as &#34;/&#39;, which are equivalent
+        return str(_markupsafe_escape(text))
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+_TEXT_SPECIALS_RE = re.compile(r'[&<>]')
+# Same entities as html.escape(quote=False): quotes need no escaping outside attributes
+_TEXT_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+})
+
+
+@lru_cache(maxsize=2048)
+def _escape_text(text: str) -> str:
+    """Escape text that lands in element content, never inside an attribute value."""
+    if _TEXT_SPECIALS_RE.search(text) is None:
+        return text
+    return text.translate(_TEXT_ESCAPE_TABLE)
 
 
 def _render_item(
@@ -18,77 +137,83 @@ def _render_item(
     show_quality: bool = False,
 ) -> str:
     """Render a single digest item as HTML. Optionally include quality gate info."""
-    title = _escape_html(item.title)
+    title = _escape_text(item.title)
     url = (item.url or "").strip()
     if url:
         url_escaped = _escape_html(url)
         title_block = f"<h3><a href=\"{url_escaped}\">{title}</a></h3>"
     else:
         title_block = f"<h3>{title}</h3>"
-    published = _escape_html(item.published_date) if (item.published_date and item.published_date.strip()) else "—"
-    publisher = _escape_html(item.publisher or "")
-    summary = _escape_html(item.summary) if (item.summary and item.summary.strip()) else "(No summary)"
-    parts = [
-        title_block,
-        f"<p><b>Published:</b> {published} | {publisher}</p>",
-        f"<p>{summary}</p>",
-    ]
+    published = _escape_text(item.published_date) if (item.published_date and item.published_date.strip()) else "—"
+    publisher = _escape_text(item.publisher or "")
+    summary = _escape_text(item.summary) if (item.summary and item.summary.strip()) else "(No summary)"
+    quality_block = ""
     if show_quality and item.quality:
         q = item.quality
-        verdict = _escape_html(q.get("verdict", ""))
-        confidence = _escape_html(q.get("confidence", ""))
-        reason = _escape_html(q.get("reason", ""))
-        parts.append(
-            f"<p><b>Quality gate:</b> {verdict} ({confidence}) — {reason}</p>"
-        )
-    parts.append("<hr/>")
-    return "\n              ".join(parts)
+        verdict = _escape_text(q.get("verdict", ""))
+        confidence = _escape_text(q.get("confidence", ""))
+        reason = _escape_text(q.get("reason", ""))
+        quality_block = f"<p><b>Quality gate:</b> {verdict} ({confidence}) — {reason}</p>"
+    return (
+        f"{title_block}<p><b>Published:</b> {published} | {publisher}</p>"
+        f"<p>{summary}</p>{quality_block}<hr/>"
+    )
+
 
+# Static fragments of the digest email, built once at import
+_NO_ITEMS_HTML = "<p>No new items today.</p>"
+_DROPPED_HEADER_HTML = (
+    "<h2>Dropped items (for review)</h2>"
+    "<p>Items below were found by search but did not pass the HDC relevance quality gate. "
+    "Included so you can review what was filtered and evaluate the gate.</p>"
+)
+_NO_DROPPED_HTML = "<p>No items were dropped by the quality gate for this run.</p>"
 
-def render_email(digest: DigestResult) -> str:
-    """Render digest as HTML email content. Kept items first, then dropped items for review."""
-    html_content = [f"<h1>HDC Daily Digest</h1><p>Date: {_escape_html(digest.date_utc)}</p>"]
+
+def render_email(digest: DigestResult, out: Optional[TextIO] = None) -> Optional[str]:
+    """Render digest as HTML email content. Kept items first, then dropped items for review.
+
+    Returns the HTML, or writes it fragment by fragment to out (returning None) so large
+    documents can be streamed to a file without being built in memory first.
+    """
+    html_content: List[str] = []
+    write = html_content.append if out is None else out.write
+    write(f"<h1>HDC Daily Digest</h1><p>Date: {_escape_text(digest.date_utc)}</p>")
 
     # --- Kept items (main digest) ---
     total = 0
     for sec in digest.sections:
         if not sec.items:
             continue
-        html_content.append(f"<h2>{_escape_html(sec.name)}</h2>")
+        write(f"<h2>{_escape_text(sec.name)}</h2>")
         for item in sec.items:
             total += 1
-            html_content.append(_render_item(item, show_quality=False))
+            write(_render_item(item, show_quality=False))
 
     if total == 0:
-        html_content.append("<p>No new items today.</p>")
+        write(_NO_ITEMS_HTML)
 
     # --- Dropped items (for review) ---
     # Always include this section so readers see what was found but filtered by the gate.
     total_dropped = sum(len(sec.dropped_items) for sec in digest.sections)
-    html_content.append("<h2>Dropped items (for review)</h2>")
-    html_content.append(
-        "<p>Items below were found by search but did not pass the HDC relevance quality gate. "
-        "Included so you can review what was filtered and evaluate the gate.</p>"
-    )
+    write(_DROPPED_HEADER_HTML)
     if total_dropped > 0:
         for sec in digest.sections:
             if not sec.dropped_items:
                 continue
-            html_content.append(f"<h3>{_escape_html(sec.name)}</h3>")
+            write(f"<h3>{_escape_text(sec.name)}</h3>")
             for item in sec.dropped_items:
-                html_content.append(_render_item(item, show_quality=True))
+                write(_render_item(item, show_quality=True))
     else:
-        html_content.append("<p>No items were dropped by the quality gate for this run.</p>")
+        write(_NO_DROPPED_HTML)
 
-    return "".join(html_content)
+    return "".join(html_content) if out is None else None
 
 
-def send_digest_email(digest: DigestResult) -> None:
-    """Send digest email via Resend API."""
+def send_digest_email(digest: DigestResult, html_body: Optional[str] = None) -> None:
+    """Send digest email via Resend API. Pass html_body to reuse an already rendered email."""
     # Validate required environment variables
-    api_key = os.environ.get("RESEND_API_KEY")
-    email_from = os.environ.get("EMAIL_FROM")
-    email_to = os.environ.get("EMAIL_TO")
+    api_key, email_from, email_to = _email_settings()
     
     if not api_key:
         raise ValueError("RESEND_API_KEY environment variable is required")
@@ -97,26 +222,21 @@ def send_digest_email(digest: DigestResult) -> None:
     if not email_to:
         raise ValueError("EMAIL_TO environment variable is required")
     
-    resend.api_key = api_key
-
     # Construct email parameters
     params = {
         "from": email_from,
         "to": [email_to],
         "subject": f"HDC Daily Digest — {digest.date_utc}",
-        "html": render_email(digest),
+        "html": html_body if html_body is not None else render_email(digest),
     }
-    
-    # Type cast to satisfy type checker - dict is compatible with SendParams at runtime
-    resend.Emails.send(cast(resend.Emails.SendParams, params))
+
+    _send_via_resend(api_key, params)
 
 
 def send_error_email(error: Exception, context: str = "") -> None:
     """Send error notification email via Resend API."""
     # Validate required environment variables
-    api_key = os.environ.get("RESEND_API_KEY")
-    email_from = os.environ.get("EMAIL_FROM")
-    email_to = os.environ.get("EMAIL_TO")
+    api_key, email_from, email_to = _email_settings()
     
     if not api_key:
         # Can't send email if API key is missing - log to stderr instead
@@ -129,8 +249,6 @@ def send_error_email(error: Exception, context: str = "") -> None:
         print(f"ERROR: Cannot send error email - EMAIL_TO missing. Original error: {error}", file=sys.stderr)
         return
     
-    resend.api_key = api_key
-    
     # Format error details
     error_type = type(error).__name__
     error_message = str(error)
@@ -166,7 +284,7 @@ def send_error_email(error: Exception, context: str = "") -> None:
     }
     
     try:
-        resend.Emails.send(cast(resend.Emails.SendParams, params))
+        _send_via_resend(api_key, params)
     except Exception as email_error:
         # If sending error email fails, log to stderr
         print(f"ERROR: Failed to send error notification email: {email_error}", file=sys.stderr)
@@ -0,0 +1,25 @@
+"""JSON helpers that use orjson when it is installed and fall back to the stdlib json module."""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup; install with `pip install -e .[fast]`
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON. Raises json.JSONDecodeError (orjson's error subclasses it)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string: compact, or indented by two spaces when pretty."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else None
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(obj, default=default, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,71 @@
+"""Persistent on-disk cache for LLM responses, keyed by a SHA-256 of the prompt."""
+import copy
+import hashlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import fastjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path("data/llm_cache.json")
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+
+_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def cache_key(model: str, instructions: str, prompt: str) -> str:
+    """Build a stable cache key from everything that determines the response."""
+    payload = json.dumps(
+        {"model": model, "instructions": instructions, "prompt": prompt},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _load() -> Dict[str, Dict[str, Any]]:
+    """Load the cache file once per process; a missing or corrupt file yields an empty cache."""
+    global _cache
+    if _cache is None:
+        try:
+            _cache = fastjson.loads(CACHE_PATH.read_bytes())
+        except FileNotFoundError:
+            _cache = {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable LLM cache at {CACHE_PATH}: {e}")
+            _cache = {}
+    return _cache
+
+
+def _save(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Write the cache atomically so an interrupted run never leaves a truncated file."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(fastjson.dumps(cache), encoding="utf-8")
+    tmp_path.replace(CACHE_PATH)
+
+
+def get(key: str) -> Optional[Any]:
+    """Return a copy of the cached value for key, or None if missing or expired."""
+    cache = _load()
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry.get("expires_at", 0) < time.time():
+        del cache[key]
+        return None
+    return copy.deepcopy(entry.get("value"))
+
+
+def set(key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS) -> None:
+    """Store value under key for ttl seconds and persist to disk."""
+    cache = _load()
+    now = time.time()
+    # Drop expired entries on write so the file does not grow without bound
+    for k in [k for k, e in cache.items() if e.get("expires_at", 0) < now]:
+        del cache[k]
+    cache[key] = {"value": copy.deepcopy(value), "expires_at": now + ttl}
+    _save(cache)
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """CLI tool for querying the HDC digest database."""
 import argparse
-import json
 import sys
-from typing import Optional
+from typing import List, Optional
+from . import fastjson
 from .store import (
+    ORDER_BY_CLAUSES,
     get_all_items,
     get_item_by_url,
     get_items_by_date_range,
@@ -14,17 +15,27 @@ from .store import (
 
 def format_item(item: dict) -> str:
     """Format a single item for display."""
-    lines = [
-        f"Title: {item['title']}",
-        f"URL: {item['url']}",
-        f"Section: {item['section_name']} | Type: {item['source_type']}",
-        f"Published: {item['published_date'] or 'N/A'} | Publisher: {item['publisher'] or 'N/A'}",
-        f"First Seen: {item['first_seen_date']} | Seen {item['seen_count']} time(s)",
-        f"Summary: {item['summary']}",
-    ]
+    text = (
+        f"Title: {item['title']}\n"
+        f"URL: {item['url']}\n"
+        f"Section: {item['section_name']} | Type: {item['source_type']}\n"
+        f"Published: {item['published_date'] or 'N/A'} | Publisher: {item['publisher'] or 'N/A'}\n"
+        f"First Seen: {item['first_seen_date']} | Seen {item['seen_count']} time(s)\n"
+        f"Summary: {item['summary']}"
+    )
     if item.get('quality_verdict'):
-        lines.append(f"Quality: {item['quality_verdict']} ({item.get('quality_confidence', 'N/A')})")
-    return "\n".join(lines)
+        text += f"\nQuality: {item['quality_verdict']} ({item.get('quality_confidence', 'N/A')})"
+    return text
+
+
+def format_items(items: List[dict]) -> str:
+    """Format a numbered list of items as one block, so it can be written in a single call."""
+    separator = "=" * 80
+    total = len(items)
+    return "".join(
+        f"{separator}\nItem {i}/{total}\n{separator}\n{format_item(item)}\n\n"
+        for i, item in enumerate(items, 1)
+    )
 
 
 def cmd_list(args: argparse.Namespace) -> None:
@@ -38,19 +49,13 @@ def cmd_list(args: argparse.Namespace) -> None:
     )
     
     if args.json:
-        print(json.dumps(items, indent=2))
+        print(fastjson.dumps(items, pretty=True))
     else:
         if not items:
             print("No items found.")
             return
         
-        print(f"Found {len(items)} item(s):\n")
-        for i, item in enumerate(items, 1):
-            print(f"{'=' * 80}")
-            print(f"Item {i}/{len(items)}")
-            print(f"{'=' * 80}")
-            print(format_item(item))
-            print()
+        sys.stdout.write(f"Found {len(items)} item(s):\n\n{format_items(items)}")
 
 
 def cmd_show(args: argparse.Namespace) -> None:
@@ -61,7 +66,7 @@ def cmd_show(args: argparse.Namespace) -> None:
         sys.exit(1)
     
     if args.json:
-        print(json.dumps(item, indent=2))
+        print(fastjson.dumps(item, pretty=True))
     else:
         print(format_item(item))
 
@@ -71,19 +76,16 @@ def cmd_date_range(args: argparse.Namespace) -> None:
     items = get_items_by_date_range(args.start_date, args.end_date)
     
     if args.json:
-        print(json.dumps(items, indent=2))
+        print(fastjson.dumps(items, pretty=True))
     else:
         if not items:
             print(f"No items found between {args.start_date} and {args.end_date}.")
             return
         
-        print(f"Found {len(items)} item(s) between {args.start_date} and {args.end_date}:\n")
-        for i, item in enumerate(items, 1):
-            print(f"{'=' * 80}")
-            print(f"Item {i}/{len(items)}")
-            print(f"{'=' * 80}")
-            print(format_item(item))
-            print()
+        sys.stdout.write(
+            f"Found {len(items)} item(s) between {args.start_date} and {args.end_date}:\n\n"
+            f"{format_items(items)}"
+        )
 
 
 def cmd_stats(args: argparse.Namespace) -> None:
@@ -91,7 +93,7 @@ def cmd_stats(args: argparse.Namespace) -> None:
     stats = get_statistics()
     
     if args.json:
-        print(json.dumps(stats, indent=2))
+        print(fastjson.dumps(stats, pretty=True))
     else:
         print("Database Statistics")
         print("=" * 80)
@@ -156,7 +158,9 @@ Examples:
     list_parser.add_argument(
         "--order-by",
         default="first_seen_date DESC",
-        help="SQL ORDER BY clause (default: first_seen_date DESC)"
+        choices=ORDER_BY_CLAUSES,
+        metavar="ORDER_BY",
+        help="Sort order: '<column> ASC|DESC' for first_seen_date, last_seen_date, published_date, seen_count or title (default: first_seen_date DESC)"
     )
     list_parser.set_defaults(func=cmd_list)
     
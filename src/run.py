@@ -1,19 +1,8 @@
 import argparse
-import json
 import logging
 import sys
-import webbrowser
 from pathlib import Path
-from .digest import run_digest
-from .store import load_seen_urls, load_seen_dropped_urls, filter_new, save_items
-from .emailer import send_digest_email, send_error_email, render_email
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
 logger = logging.getLogger(__name__)
 
 def main():
@@ -35,20 +24,34 @@ def main():
         action="store_true",
         help="Generate digest, save email HTML to file and open in browser (implies dry-run)"
     )
+    parser.add_argument(
+        "--single-call",
+        action="store_true",
+        help="Search all sections in one LLM call (falls back to per-section calls if a section comes back empty)"
+    )
     args = parser.parse_args()
+
+    # Configure logging and load the pipeline only once we know we are running (not --help)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    from .digest import run_digest
+    from .store import filter_new, save_items
+    from .emailer import send_digest_email, send_error_email, render_email
+    from . import fastjson
     
     try:
         # Generate digest
         logger.info("Starting digest workflow...")
-        digest = run_digest(days_back=args.days_back)
+        digest = run_digest(days_back=args.days_back, single_call=args.single_call)
 
         # Filter out already-seen items
         logger.info("Filtering already-seen items...")
-        seen_urls = load_seen_urls()
-        seen_dropped_urls = load_seen_dropped_urls()
         initial_count = sum(len(s.items) for s in digest.sections)
         initial_dropped_count = sum(len(s.dropped_items) for s in digest.sections)
-        digest = filter_new(digest, seen_urls, seen_dropped_urls)
+        digest = filter_new(digest)
         new_count = sum(len(s.items) for s in digest.sections)
         new_dropped_count = sum(len(s.dropped_items) for s in digest.sections)
         logger.info(
@@ -70,29 +73,31 @@ def main():
         logger.info("✅ Items saved to database")
 
         if args.dry_run or args.preview:
-            html_body = render_email(digest)
             if args.preview:
                 preview_path = Path("email-preview.html")
-                full_html = (
-                    '<!DOCTYPE html><html><head><meta charset="UTF-8">'
-                    '<meta name="viewport" content="width=device-width, initial-scale=1">'
-                    '<title>HDC Daily Digest – Preview</title>'
-                    '</head><body style="font-family: system-ui, sans-serif; max-width: 720px; margin: 0 auto; padding: 1rem;">'
-                    + html_body
-                    + "</body></html>"
-                )
-                preview_path.write_text(full_html, encoding="utf-8")
+                # Stream the email straight into the file rather than building it in memory
+                with preview_path.open("w", encoding="utf-8") as f:
+                    f.write(
+                        '<!DOCTYPE html><html><head><meta charset="UTF-8">'
+                        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+                        '<title>HDC Daily Digest – Preview</title>'
+                        '</head><body style="font-family: system-ui, sans-serif; max-width: 720px; margin: 0 auto; padding: 1rem;">'
+                    )
+                    render_email(digest, out=f)
+                    f.write("</body></html>")
                 abs_path = preview_path.resolve()
                 logger.info("Wrote %s", abs_path)
+                import webbrowser
                 webbrowser.open(abs_path.as_uri())
             else:
+                html_body = render_email(digest)
                 # Dry run: print email content instead of sending
                 print("=" * 80)
                 print("DRY RUN MODE - Email would be sent with the following content:")
                 print("=" * 80)
                 print(html_body)
                 print("=" * 80)
-                print(f"Total items in digest: {sum(len(s.items) for s in digest.sections)}")
+                print(f"Total items in digest: {new_count}")
                 print(f"Duration: {digest.duration_seconds:.2f}s")
                 print("=" * 80)
             
@@ -101,8 +106,8 @@ def main():
                 summary = {
                     "date_utc": digest.date_utc,
                     "duration_seconds": digest.duration_seconds,
-                    "total_items": sum(len(s.items) for s in digest.sections),
-                    "total_dropped": sum(len(s.dropped_items) for s in digest.sections),
+                    "total_items": new_count,
+                    "total_dropped": new_dropped_count,
                     "sections": [
                         {
                             "name": s.name,
@@ -115,9 +120,9 @@ def main():
                     "top_themes": digest.top_themes
                 }
                 print("\nJSON Summary:")
-                print(json.dumps(summary, indent=2))
+                print(fastjson.dumps(summary, pretty=True))
                 print("\nFull JSON (including dropped items):")
-                print(json.dumps(digest.to_dict(), indent=2, default=str))
+                print(fastjson.dumps(digest.to_dict(), default=str, pretty=True))
         else:
             # Send digest email (will include "No new items today" if empty)
             logger.info("Sending digest email...")
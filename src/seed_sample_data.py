@@ -1,10 +1,12 @@
 """Seed the SQLite database with sample HDC items for local testing."""
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Tuple
 
-from .store import _init_db, _get_db_connection
+from .store import _IGNORE_ON_CONFLICT, _bulk_insert_items, _db_transaction, _init_db
 
 logging.basicConfig(
     level=logging.INFO,
@@ -161,6 +163,60 @@ SAMPLE_ITEMS = [
     ),
 ]
 
+# Added in recent weeks only, with repeated topics, so trends show variation
+RECENT_SAMPLE_ITEMS = [
+    (
+        "Binding operations in production VSA systems",
+        "Case study on binding and bundling in large-scale vector symbolic architectures. Similarity search and encoding best practices.",
+        "paper",
+        "arXiv",
+        "Papers",
+    ),
+    (
+        "Neuromorphic HDC accelerator tape-out",
+        "First silicon for a neuromorphic hyperdimensional computing accelerator. Binding and permutation implemented in analog domain.",
+        "news",
+        "EE Times",
+        "News",
+    ),
+    (
+        "Vector symbolic architectures for robotics",
+        "Using binding and bundling for sensorimotor representations in robots. Hypervector encoding and similarity search for policy learning.",
+        "paper",
+        "RSS",
+        "Papers",
+    ),
+    (
+        "Hardware survey: HDC and VSA chips",
+        "Survey of FPGA and ASIC implementations of hyperdimensional computing. Binding, bundling, and energy efficiency compared.",
+        "blog",
+        "IEEE Spectrum",
+        "Blogs",
+    ),
+    (
+        "MAP architecture: binding and capacity",
+        "Analysis of Multiply-Add-Permute (MAP) binding in vector symbolic architectures. Capacity and similarity search under noise.",
+        "paper",
+        "arXiv",
+        "Papers",
+    ),
+]
+
+# (weeks_ago, url prefix, item) for every sample row, computed once at import.
+# Main items vary first_seen_date 0 to 51 weeks ago with some clustering; recent items fall in the
+# last 8 weeks.
+_SEED_SPECS = tuple(
+    (
+        (i * 3 + (i % 5)) % 52,
+        f"https://example.com/sample/{item[4].lower()}/{i:03d}",
+        item,
+    )
+    for i, item in enumerate(SAMPLE_ITEMS)
+) + tuple(
+    (j % 8, f"https://example.com/sample/extra/{j}", item)
+    for j, item in enumerate(RECENT_SAMPLE_ITEMS)
+)
+
 QUALITY_JSON = json.dumps({
     "verdict": "KEEP",
     "confidence": "high",
@@ -168,123 +224,61 @@ QUALITY_JSON = json.dumps({
 })
 
 
+def _sample_row(
+    url: str,
+    title: str,
+    summary: str,
+    source_type: str,
+    publisher: str,
+    section_name: str,
+    first_seen_str: str,
+) -> Tuple[Any, ...]:
+    """Build the INSERT parameters for one sample item."""
+    return (
+        url,
+        title,
+        first_seen_str,
+        summary,
+        source_type,
+        publisher,
+        section_name,
+        "KEEP",
+        "high",
+        "Clearly about HDC/VSA.",
+        QUALITY_JSON,
+        first_seen_str,
+        first_seen_str,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_seed_rows(base_date: date) -> Tuple[Tuple[Any, ...], ...]:
+    """Build the insert rows for base_date; only the date-derived fields vary per call."""
+    # Rows share a handful of week offsets: format each date once
+    iso_dates = {
+        weeks_ago: (base_date - timedelta(weeks=weeks_ago)).isoformat()
+        for weeks_ago in {spec[0] for spec in _SEED_SPECS}
+    }
+    rows = []
+    for weeks_ago, url_prefix, (title, summary, source_type, publisher, section_name) in _SEED_SPECS:
+        first_seen_str = iso_dates[weeks_ago]
+        url = f"{url_prefix}-{first_seen_str}"
+        rows.append(_sample_row(url, title, summary, source_type, publisher, section_name, first_seen_str))
+    return tuple(rows)
+
+
 def _seed_sample_data() -> int:
     """Insert sample items into the database. Items are spread over the last 52 weeks.
     Returns the number of rows inserted.
     """
     _init_db()
-    conn = _get_db_connection()
-    try:
-        base_date = datetime.now(timezone.utc).date()
-        inserted = 0
-        # Spread items over the last 52 weeks; repeat some items in different weeks for trend variety
-        for i, (title, summary, source_type, publisher, section_name) in enumerate(SAMPLE_ITEMS):
-            # Vary first_seen_date: 0 to 51 weeks ago, with some clustering
-            weeks_ago = (i * 3 + (i % 5)) % 52
-            first_seen = base_date - timedelta(weeks=weeks_ago)
-            first_seen_str = first_seen.isoformat()
-            url = f"https://example.com/sample/{section_name.lower()}/{i:03d}-{first_seen_str}"
-            cur = conn.execute(
-                """
-                INSERT OR IGNORE INTO items (
-                    url, title, published_date, summary, source_type,
-                    publisher, section_name, quality_verdict, quality_confidence,
-                    quality_reason, quality_json, first_seen_date, last_seen_date, seen_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                """,
-                (
-                    url,
-                    title,
-                    first_seen_str,
-                    summary,
-                    source_type,
-                    publisher,
-                    section_name,
-                    "KEEP",
-                    "high",
-                    "Clearly about HDC/VSA.",
-                    QUALITY_JSON,
-                    first_seen_str,
-                    first_seen_str,
-                ),
-            )
-            if cur.rowcount:
-                inserted += 1
-        conn.commit()
-        # Add more items with repeated topics in recent weeks so trends show variation
-        extra = [
-            (
-                "Binding operations in production VSA systems",
-                "Case study on binding and bundling in large-scale vector symbolic architectures. Similarity search and encoding best practices.",
-                "paper",
-                "arXiv",
-                "Papers",
-            ),
-            (
-                "Neuromorphic HDC accelerator tape-out",
-                "First silicon for a neuromorphic hyperdimensional computing accelerator. Binding and permutation implemented in analog domain.",
-                "news",
-                "EE Times",
-                "News",
-            ),
-            (
-                "Vector symbolic architectures for robotics",
-                "Using binding and bundling for sensorimotor representations in robots. Hypervector encoding and similarity search for policy learning.",
-                "paper",
-                "RSS",
-                "Papers",
-            ),
-            (
-                "Hardware survey: HDC and VSA chips",
-                "Survey of FPGA and ASIC implementations of hyperdimensional computing. Binding, bundling, and energy efficiency compared.",
-                "blog",
-                "IEEE Spectrum",
-                "Blogs",
-            ),
-            (
-                "MAP architecture: binding and capacity",
-                "Analysis of Multiply-Add-Permute (MAP) binding in vector symbolic architectures. Capacity and similarity search under noise.",
-                "paper",
-                "arXiv",
-                "Papers",
-            ),
-        ]
-        for j, (title, summary, source_type, publisher, section_name) in enumerate(extra):
-            # Recent weeks only
-            weeks_ago = j % 8
-            first_seen = base_date - timedelta(weeks=weeks_ago)
-            first_seen_str = first_seen.isoformat()
-            url = f"https://example.com/sample/extra/{j}-{first_seen_str}"
-            cur = conn.execute(
-                """
-                INSERT OR IGNORE INTO items (
-                    url, title, published_date, summary, source_type,
-                    publisher, section_name, quality_verdict, quality_confidence,
-                    quality_reason, quality_json, first_seen_date, last_seen_date, seen_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                """,
-                (
-                    url,
-                    title,
-                    first_seen_str,
-                    summary,
-                    source_type,
-                    publisher,
-                    section_name,
-                    "KEEP",
-                    "high",
-                    "Clearly about HDC/VSA.",
-                    QUALITY_JSON,
-                    first_seen_str,
-                    first_seen_str,
-                ),
-            )
-            if cur.rowcount:
-                inserted += 1
-        conn.commit()
-        return inserted
-    finally:
-        conn.close()
+    rows = _build_seed_rows(datetime.now(timezone.utc).date())
+
+    # One transaction and one multi-row INSERT for every row (a single commit/fsync)
+    with _db_transaction() as conn:
+        changes_before = conn.total_changes
+        _bulk_insert_items(conn, "items", rows, _IGNORE_ON_CONFLICT)
+        return conn.total_changes - changes_before
 
 
 def main() -> None:
@@ -1,25 +1,32 @@
-import json
+import atexit
 import sqlite3
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Set, List, Optional, Dict, Any
+from functools import lru_cache
+from itertools import chain
+from typing import Set, List, Optional, Dict, Any, Iterable, Sequence, Tuple
 from contextlib import contextmanager
 
+from . import fastjson
 from .digest import DigestResult, DigestItem
 
 
 DB_PATH = Path("hdc_digest.db")
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     """
     Normalize URL for deduplication so the same article is not treated as different
     when it appears with e.g. trailing slash or different scheme casing.
+    Memoized: filter_new and save_items normalize the same URLs in one run.
     """
     if not url or not isinstance(url, str):
         return url or ""
     u = url.strip()
-    if not u:
+    # Common case (no query string, no trailing slash): already normalized
+    if "?" not in u and u[-1:] != "/":
         return u
     # Strip trailing slash (path only; do not strip trailing slash from "https://example.com/")
     if len(u) > 1 and u[-1] == "/" and "?" not in u and "#" not in u:
@@ -31,17 +38,76 @@ def normalize_url(url: str) -> str:
     return u
 
 
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.RLock()
+_db_initialized = False
+
+
 def _get_db_connection() -> sqlite3.Connection:
     """Get a database connection with proper configuration."""
-    conn = sqlite3.connect(DB_PATH)
+    # Shared across threads by _get_conn; access is serialized with _conn_lock
+    # isolation_level=None: autocommit unless _db_transaction opens an explicit transaction, instead
+    # of the sqlite3 module's implicit BEGINs (which DDL and some statements bypass)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    # Per-connection settings. WAL (set once in _init_db) keeps NORMAL durable across crashes;
+    # at worst the last commit is lost on power failure, never the database itself.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB (negative = KiB)
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
     return conn
 
 
+def _get_conn() -> sqlite3.Connection:
+    """Return the process-wide connection, opening it on first use."""
+    global _conn
+    with _conn_lock:
+        if _conn is None:
+            _conn = _get_db_connection()
+            atexit.register(_close_conn)
+        return _conn
+
+
+def _close_conn() -> None:
+    """Close the shared connection; closing the last connection checkpoints the WAL into the db file."""
+    global _conn, _db_initialized
+    with _conn_lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+            _db_initialized = False
+
+
+# Larger pages fit more of the text-heavy rows per page: shallower b-trees, fewer page reads per scan
+PAGE_SIZE = 8192
+
+
+def _ensure_page_size(conn: sqlite3.Connection) -> None:
+    """Use PAGE_SIZE for new databases and rewrite existing ones once (VACUUM) if they differ."""
+    if conn.execute("PRAGMA page_size").fetchone()[0] == PAGE_SIZE:
+        return
+    # Takes effect immediately on an empty database; otherwise VACUUM must rebuild the file,
+    # which is not possible in WAL mode, so drop back to a rollback journal first
+    conn.execute("PRAGMA journal_mode=DELETE")
+    conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+    if conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is not None:
+        conn.execute("VACUUM")
+
+
 def _init_db() -> None:
-    """Initialize the database schema if it doesn't exist."""
-    conn = _get_db_connection()
-    try:
+    """Initialize the database schema if it doesn't exist (once per connection)."""
+    global _db_initialized
+    with _conn_lock:
+        if _db_initialized:
+            return
+        conn = _get_conn()
+        _ensure_page_size(conn)
+        # Persistent: stored in the database file, so later connections inherit it. The WAL is
+        # checkpointed back into hdc_digest.db when the last connection closes (_close_conn runs
+        # at exit), so the file cached by the workflows stays self-contained.
+        conn.execute("PRAGMA journal_mode=WAL")
+
         conn.execute("""
             CREATE TABLE IF NOT EXISTS items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -63,22 +129,29 @@ def _init_db() -> None:
             )
         """)
         
+        # Covers the trend scan (date range -> date, title, summary) without reading table rows;
+        # it also serves every plain first_seen_date lookup, replacing idx_first_seen_date
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_url ON items(url)
-        """)
-        
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_first_seen_date ON items(first_seen_date)
+            CREATE INDEX IF NOT EXISTS idx_items_date_cover ON items(first_seen_date, title, summary)
         """)
+        conn.execute("DROP INDEX IF EXISTS idx_first_seen_date")
         
+        # Composite indexes serve get_all_items' filter + default "first_seen_date DESC" order
+        # without a sort; they also cover plain section/source lookups, so the old
+        # single-column indexes are dropped.
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_section_name ON items(section_name)
+            CREATE INDEX IF NOT EXISTS idx_section_first_seen ON items(section_name, first_seen_date DESC)
         """)
-        
+
         conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_source_type ON items(source_type)
+            CREATE INDEX IF NOT EXISTS idx_source_first_seen ON items(source_type, first_seen_date DESC)
         """)
 
+        conn.execute("DROP INDEX IF EXISTS idx_section_name")
+        conn.execute("DROP INDEX IF EXISTS idx_source_type")
+        # url is UNIQUE, so its automatic index already serves every URL lookup
+        conn.execute("DROP INDEX IF EXISTS idx_url")
+
         conn.execute("""
             CREATE TABLE IF NOT EXISTS dropped_items (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -100,10 +173,6 @@ def _init_db() -> None:
             )
         """)
 
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_dropped_url ON dropped_items(url)
-        """)
-
         conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_dropped_first_seen_date ON dropped_items(first_seen_date)
         """)
@@ -111,225 +180,188 @@ def _init_db() -> None:
         conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_dropped_section_name ON dropped_items(section_name)
         """)
-        
-        conn.commit()
-    finally:
-        conn.close()
+
+        conn.execute("DROP INDEX IF EXISTS idx_dropped_url")
+
+        # Autocommit connection: each DDL statement above is already durable
+        _db_initialized = True
 
 
 @contextmanager
 def _db_transaction():
-    """Context manager for database transactions."""
-    conn = _get_db_connection()
-    try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
-
-
-def load_seen_urls() -> Set[str]:
-    """Load set of normalized URLs that have been seen before (for dedup against cache/DB)."""
+    """Context manager for database transactions (BEGIN IMMEDIATE ... COMMIT, or ROLLBACK on error)."""
+    with _conn_lock:
+        conn = _get_conn()
+        # IMMEDIATE takes the write lock up front, so the transaction cannot fail midway on upgrade
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+# Stay under SQLite's default bound on host parameters per statement (999 before 3.32)
+_MAX_SQL_PARAMS = 900
+
+
+def _seen_urls(table: str, urls: Iterable[str]) -> Set[str]:
+    """Return the (already normalized) urls that exist in table (index probes only)."""
+    candidates = list(set(urls))
+    seen: Set[str] = set()
     _init_db()
-    conn = _get_db_connection()
-    try:
-        cursor = conn.execute("SELECT url FROM items")
-        return {normalize_url(row["url"]) for row in cursor.fetchall()}
-    finally:
-        conn.close()
+    with _conn_lock:
+        cursor = _get_conn().cursor()
+        cursor.row_factory = None  # plain 1-tuples; stored URLs are already normalized
+        for start in range(0, len(candidates), _MAX_SQL_PARAMS):
+            chunk = candidates[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT url FROM {table} WHERE url IN ({placeholders})", chunk)
+            seen.update(url for url, in cursor)
+    return seen
+
+
+def filter_new(digest: DigestResult) -> DigestResult:
+    """Filter out kept and dropped items that have been seen before.
+
+    Only the digest's own URLs are looked up (stored URLs are already normalized), rather than
+    loading every URL in the database.
+    """
+    # Normalize each URL once; the lookups and the filtering below reuse these keys
+    kept_keys = [[normalize_url(it.url) for it in section.items] for section in digest.sections]
+    dropped_keys = [[normalize_url(it.url) for it in section.dropped_items] for section in digest.sections]
+    seen_urls = _seen_urls("items", chain.from_iterable(kept_keys))
+    dropped_seen = _seen_urls("dropped_items", chain.from_iterable(dropped_keys))
+    for section, kept, dropped in zip(digest.sections, kept_keys, dropped_keys):
+        # Rebuild a list only when something in it was seen before
+        if not seen_urls.isdisjoint(kept):
+            section.items = [it for it, key in zip(section.items, kept) if key not in seen_urls]
+        if not dropped_seen.isdisjoint(dropped):
+            section.dropped_items = [
+                it for it, key in zip(section.dropped_items, dropped) if key not in dropped_seen
+            ]
+    return digest
 
 
-def load_seen_dropped_urls() -> Set[str]:
-    """Load set of normalized dropped-item URLs seen in previous runs."""
-    _init_db()
-    conn = _get_db_connection()
-    try:
-        cursor = conn.execute("SELECT url FROM dropped_items")
-        return {normalize_url(row["url"]) for row in cursor.fetchall()}
-    finally:
-        conn.close()
-
-
-def filter_new(
-    digest: DigestResult,
-    seen_urls: Set[str],
-    seen_dropped_urls: Optional[Set[str]] = None,
-) -> DigestResult:
-    """Filter out kept and dropped items that have been seen before."""
-    dropped_seen = seen_dropped_urls or set()
-    for section in digest.sections:
-        section.items = [
-            it for it in section.items
-            if normalize_url(it.url) not in seen_urls
-        ]
-        section.dropped_items = [
-            it for it in section.dropped_items
-            if normalize_url(it.url) not in dropped_seen
-        ]
-    return digest
+_ITEM_INSERT_COLUMNS = """(
+            url, title, published_date, summary, source_type,
+            publisher, section_name, quality_verdict,
+            quality_confidence, quality_reason, quality_json,
+            first_seen_date, last_seen_date, seen_count
+        )"""
+# One row's placeholders; seen_count starts at 1
+_ITEM_VALUES_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)"
+_ITEM_PARAMS_PER_ROW = 13
+
+# Refresh metadata and bump seen_count when the URL already exists
+_UPSERT_ON_CONFLICT = """
+        ON CONFLICT(url) DO UPDATE SET
+            title = excluded.title,
+            published_date = excluded.published_date,
+            summary = excluded.summary,
+            source_type = excluded.source_type,
+            publisher = excluded.publisher,
+            section_name = excluded.section_name,
+            quality_verdict = excluded.quality_verdict,
+            quality_confidence = excluded.quality_confidence,
+            quality_reason = excluded.quality_reason,
+            quality_json = excluded.quality_json,
+            last_seen_date = excluded.last_seen_date,
+            seen_count = seen_count + 1
+"""
+_IGNORE_ON_CONFLICT = "ON CONFLICT(url) DO NOTHING"
+
+
+def _bulk_insert_items(
+    conn: sqlite3.Connection,
+    table: str,
+    rows: Sequence[Tuple[Any, ...]],
+    on_conflict: str,
+) -> None:
+    """Insert _item_row-shaped rows using chunked multi-row VALUES statements.
+
+    Each chunk is parsed and planned once, instead of one VDBE run per row with executemany.
+    """
+    rows_per_chunk = _MAX_SQL_PARAMS // _ITEM_PARAMS_PER_ROW
+    for start in range(0, len(rows), rows_per_chunk):
+        chunk = rows[start:start + rows_per_chunk]
+        values = ", ".join([_ITEM_VALUES_ROW] * len(chunk))
+        conn.execute(
+            f"INSERT INTO {table} {_ITEM_INSERT_COLUMNS} VALUES {values} {on_conflict}",
+            list(chain.from_iterable(chunk)),
+        )
+
+
+def _item_row(item: DigestItem, section_name: str, date_str: str) -> tuple:
+    """Build the upsert parameters for one item, storing its normalized URL."""
+    quality = item.quality or {}
+    return (
+        # Use normalized URL for storage so dedup is consistent
+        normalize_url(item.url),
+        item.title,
+        item.published_date or None,
+        item.summary,
+        item.source_type,
+        item.publisher or None,
+        section_name,
+        quality.get("verdict"),
+        quality.get("confidence"),
+        quality.get("reason"),
+        fastjson.dumps(item.quality) if item.quality else None,
+        date_str,
+        date_str,
+    )
 
 
 def save_items(digest: DigestResult) -> None:
     """Save kept and dropped items from digest to database with full metadata."""
     _init_db()
     date_str = digest.date_utc
-    
+    kept_rows = [
+        _item_row(item, section.name, date_str)
+        for section in digest.sections
+        for item in section.items
+    ]
+    dropped_rows = [
+        _item_row(item, section.name, date_str)
+        for section in digest.sections
+        for item in section.dropped_items
+    ]
+
     with _db_transaction() as conn:
-        for section in digest.sections:
-            for item in section.items:
-                # Extract quality information
-                quality_verdict = None
-                quality_confidence = None
-                quality_reason = None
-                quality_json = None
-                
-                if item.quality:
-                    quality_verdict = item.quality.get("verdict")
-                    quality_confidence = item.quality.get("confidence")
-                    quality_reason = item.quality.get("reason")
-                    quality_json = json.dumps(item.quality)
-                
-                # Use normalized URL for lookups and storage so dedup is consistent
-                stored_url = normalize_url(item.url)
-                # Check if URL already exists
-                cursor = conn.execute("SELECT url, last_seen_date, seen_count FROM items WHERE url = ?", (stored_url,))
-                existing = cursor.fetchone()
-                
-                if existing:
-                    # Update existing record
-                    conn.execute("""
-                        UPDATE items
-                        SET title = ?,
-                            published_date = ?,
-                            summary = ?,
-                            source_type = ?,
-                            publisher = ?,
-                            section_name = ?,
-                            quality_verdict = ?,
-                            quality_confidence = ?,
-                            quality_reason = ?,
-                            quality_json = ?,
-                            last_seen_date = ?,
-                            seen_count = seen_count + 1
-                        WHERE url = ?
-                    """, (
-                        item.title,
-                        item.published_date or None,
-                        item.summary,
-                        item.source_type,
-                        item.publisher or None,
-                        section.name,
-                        quality_verdict,
-                        quality_confidence,
-                        quality_reason,
-                        quality_json,
-                        date_str,
-                        stored_url,
-                    ))
-                else:
-                    # Insert new record
-                    conn.execute("""
-                        INSERT INTO items (
-                            url, title, published_date, summary, source_type,
-                            publisher, section_name, quality_verdict,
-                            quality_confidence, quality_reason, quality_json,
-                            first_seen_date, last_seen_date, seen_count
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                    """, (
-                        stored_url,
-                        item.title,
-                        item.published_date or None,
-                        item.summary,
-                        item.source_type,
-                        item.publisher or None,
-                        section.name,
-                        quality_verdict,
-                        quality_confidence,
-                        quality_reason,
-                        quality_json,
-                        date_str,
-                        date_str,
-                    ))
-
-            for item in section.dropped_items:
-                quality_verdict = None
-                quality_confidence = None
-                quality_reason = None
-                quality_json = None
-
-                if item.quality:
-                    quality_verdict = item.quality.get("verdict")
-                    quality_confidence = item.quality.get("confidence")
-                    quality_reason = item.quality.get("reason")
-                    quality_json = json.dumps(item.quality)
-
-                stored_url = normalize_url(item.url)
-                cursor = conn.execute(
-                    "SELECT url FROM dropped_items WHERE url = ?",
-                    (stored_url,),
-                )
-                existing = cursor.fetchone()
-
-                if existing:
-                    conn.execute("""
-                        UPDATE dropped_items
-                        SET title = ?,
-                            published_date = ?,
-                            summary = ?,
-                            source_type = ?,
-                            publisher = ?,
-                            section_name = ?,
-                            quality_verdict = ?,
-                            quality_confidence = ?,
-                            quality_reason = ?,
-                            quality_json = ?,
-                            last_seen_date = ?,
-                            seen_count = seen_count + 1
-                        WHERE url = ?
-                    """, (
-                        item.title,
-                        item.published_date or None,
-                        item.summary,
-                        item.source_type,
-                        item.publisher or None,
-                        section.name,
-                        quality_verdict,
-                        quality_confidence,
-                        quality_reason,
-                        quality_json,
-                        date_str,
-                        stored_url,
-                    ))
-                else:
-                    conn.execute("""
-                        INSERT INTO dropped_items (
-                            url, title, published_date, summary, source_type,
-                            publisher, section_name, quality_verdict,
-                            quality_confidence, quality_reason, quality_json,
-                            first_seen_date, last_seen_date, seen_count
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
-                    """, (
-                        stored_url,
-                        item.title,
-                        item.published_date or None,
-                        item.summary,
-                        item.source_type,
-                        item.publisher or None,
-                        section.name,
-                        quality_verdict,
-                        quality_confidence,
-                        quality_reason,
-                        quality_json,
-                        date_str,
-                        date_str,
-                    ))
+        _bulk_insert_items(conn, "items", kept_rows, _UPSERT_ON_CONFLICT)
+        _bulk_insert_items(conn, "dropped_items", dropped_rows, _UPSERT_ON_CONFLICT)
 
 
 # Query functions for accessing past content
 
+# ORDER BY clauses get_all_items accepts. Only these fixed strings reach the SQL, which rules out
+# injection and keeps the set of distinct statements (and SQLite statement-cache entries) small.
+ORDER_BY_CLAUSES = tuple(
+    f"{column} {direction}"
+    for column in ("first_seen_date", "last_seen_date", "published_date", "seen_count", "title")
+    for direction in ("DESC", "ASC")
+)
+
+# items columns in table order; queries name them explicitly and zip them onto plain tuples,
+# which is cheaper than building sqlite3.Row objects and converting each with dict(row)
+_ITEM_COLUMNS = (
+    "id", "url", "title", "published_date", "summary", "source_type", "publisher",
+    "section_name", "quality_verdict", "quality_confidence", "quality_reason",
+    "first_seen_date", "last_seen_date", "seen_count", "quality_json", "created_at",
+)
+_SELECT_ITEMS = f"SELECT {', '.join(_ITEM_COLUMNS)} FROM items"
+
+
+def _query_items(conn: sqlite3.Connection, sql: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Run a query selecting _ITEM_COLUMNS and return one dict per row."""
+    cursor = conn.cursor()
+    cursor.row_factory = None  # raw tuples
+    cursor.execute(sql, params)
+    return [dict(zip(_ITEM_COLUMNS, row)) for row in cursor]
+
+
 def get_all_items(
     limit: Optional[int] = None,
     offset: int = 0,
@@ -344,15 +376,20 @@ def get_all_items(
         offset: Number of items to skip
         section_name: Filter by section name (e.g., "Papers", "News", "Blogs")
         source_type: Filter by source type (e.g., "paper", "news", "blog")
-        order_by: SQL ORDER BY clause (default: newest first)
+        order_by: One of ORDER_BY_CLAUSES (default: newest first)
     
     Returns:
         List of item dictionaries with all fields
+
+    Raises:
+        ValueError: If order_by is not one of ORDER_BY_CLAUSES
     """
+    if order_by not in ORDER_BY_CLAUSES:
+        raise ValueError(f"Unsupported order_by {order_by!r}; expected one of {', '.join(ORDER_BY_CLAUSES)}")
     _init_db()
-    conn = _get_db_connection()
-    try:
-        query = "SELECT * FROM items WHERE 1=1"
+    with _conn_lock:
+        conn = _get_conn()
+        query = f"{_SELECT_ITEMS} WHERE 1=1"
         params = []
         
         if section_name:
@@ -373,77 +410,63 @@ def get_all_items(
             query += " OFFSET ?"
             params.append(offset)
         
-        cursor = conn.execute(query, params)
-        rows = cursor.fetchall()
-        
-        return [dict(row) for row in rows]
-    finally:
-        conn.close()
+        return _query_items(conn, query, params)
 
 
 def get_item_by_url(url: str) -> Optional[Dict[str, Any]]:
     """Get a single item by URL (accepts any URL form; lookup uses normalized URL)."""
     _init_db()
-    conn = _get_db_connection()
-    try:
-        cursor = conn.execute("SELECT * FROM items WHERE url = ?", (normalize_url(url),))
-        row = cursor.fetchone()
-        return dict(row) if row else None
-    finally:
-        conn.close()
+    with _conn_lock:
+        conn = _get_conn()
+        rows = _query_items(conn, f"{_SELECT_ITEMS} WHERE url = ?", (normalize_url(url),))
+        return rows[0] if rows else None
 
 
 def get_items_by_date_range(start_date: str, end_date: str) -> List[Dict[str, Any]]:
     """Get items first seen within a date range (YYYY-MM-DD format)."""
     _init_db()
-    conn = _get_db_connection()
-    try:
-        cursor = conn.execute(
-            "SELECT * FROM items WHERE first_seen_date >= ? AND first_seen_date <= ? ORDER BY first_seen_date DESC",
+    with _conn_lock:
+        conn = _get_conn()
+        return _query_items(
+            conn,
+            f"{_SELECT_ITEMS} WHERE first_seen_date >= ? AND first_seen_date <= ? ORDER BY first_seen_date DESC",
             (start_date, end_date)
         )
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
-    finally:
-        conn.close()
 
 
 def get_statistics() -> Dict[str, Any]:
-    """Get statistics about stored items."""
+    """Get statistics about stored items (one query, one round trip)."""
     _init_db()
-    conn = _get_db_connection()
-    try:
-        stats = {}
-        
-        # Total items
-        cursor = conn.execute("SELECT COUNT(*) as count FROM items")
-        stats["total_items"] = cursor.fetchone()["count"]
-        
-        # Items by section
-        cursor = conn.execute("""
-            SELECT section_name, COUNT(*) as count
+    with _conn_lock:
+        cursor = _get_conn().cursor()
+        cursor.row_factory = None  # plain tuples, unpacked by position below
+        # The grouped counts are answered from the section/source indexes; the totals row from
+        # one aggregate pass over the narrowest index
+        cursor.execute("""
+            SELECT 'section' AS kind, section_name AS key, COUNT(*) AS count,
+                   NULL AS min_date, NULL AS max_date
             FROM items
             GROUP BY section_name
-        """)
-        stats["by_section"] = {row["section_name"]: row["count"] for row in cursor.fetchall()}
-        
-        # Items by source type
-        cursor = conn.execute("""
-            SELECT source_type, COUNT(*) as count
+            UNION ALL
+            SELECT 'source_type', source_type, COUNT(*), NULL, NULL
             FROM items
             GROUP BY source_type
+            UNION ALL
+            SELECT 'total', NULL, COUNT(*), MIN(first_seen_date), MAX(first_seen_date)
+            FROM items
         """)
-        stats["by_source_type"] = {row["source_type"]: row["count"] for row in cursor.fetchall()}
-        
-        # Date range
-        cursor = conn.execute("SELECT MIN(first_seen_date) as min_date, MAX(first_seen_date) as max_date FROM items")
-        row = cursor.fetchone()
-        if row["min_date"]:
-            stats["date_range"] = {
-                "earliest": row["min_date"],
-                "latest": row["max_date"]
-            }
-        
+        stats: Dict[str, Any] = {"total_items": 0, "by_section": {}, "by_source_type": {}}
+        for kind, key, count, min_date, max_date in cursor:
+            if kind == "section":
+                stats["by_section"][key] = count
+            elif kind == "source_type":
+                stats["by_source_type"][key] = count
+            else:
+                stats["total_items"] = count
+                if min_date:
+                    stats["date_range"] = {
+                        "earliest": min_date,
+                        "latest": max_date
+                    }
+
         return stats
-    finally:
-        conn.close()
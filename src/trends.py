@@ -1,15 +1,22 @@
 """Trend analysis module for analyzing HDC trends over time."""
 import json
 import logging
-import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-import sqlite3
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
 
-from agents import Agent, Runner
+from . import fastjson
+from .store import _conn_lock, _get_conn, _init_db
+
+if TYPE_CHECKING:
+    from agents import Agent
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; install with `pip install -e .[fast]`
+    ahocorasick = None
 
 # Configure logging
 logging.basicConfig(
@@ -48,7 +55,6 @@ class TrendAnalysis:
     period_type: str  # "week", "month", or "year"
 
 
-DB_PATH = Path("hdc_digest.db")
 SYSTEM_PROMPT = """
 You are an expert at analyzing research trends in Hyperdimensional Computing (HDC).
 
@@ -63,14 +69,34 @@ Example: ["binding operations", "neuromorphic hardware", "vector symbolic archit
 """
 
 
-def _get_db_connection() -> sqlite3.Connection:
-    """Get a database connection with proper configuration."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+_MAX_PROMPT_SUMMARY_CHARS = 500
+
+_DECODER = json.JSONDecoder()
+# Bound on '[' offsets tried by _find_json_array, so pathological output cannot go quadratic
+_MAX_ARRAY_CANDIDATES = 16
+
+
+def _find_json_array(text: str) -> Optional[List[Any]]:
+    """Return the first JSON array embedded in text, or None.
+
+    Decodes from each '[' in turn, so nested arrays and ']' inside strings parse correctly
+    (a non-greedy regex match would stop at the first ']').
+    """
+    start = text.find("[")
+    for _ in range(_MAX_ARRAY_CANDIDATES):
+        if start == -1:
+            break
+        try:
+            value = _DECODER.raw_decode(text, start)[0]
+            if isinstance(value, list):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find("[", start + 1)
+    return None
 
 
-def _extract_topics_from_items(items: List[Dict[str, Any]], agent: Agent) -> List[str]:
+def _extract_topics_from_items(items: List[Dict[str, Any]], agent: "Agent") -> List[str]:
     """Extract topics from a list of items using an agent."""
     if not items:
         return []
@@ -80,28 +106,32 @@ def _extract_topics_from_items(items: List[Dict[str, Any]], agent: Agent) -> Lis
     for item in items[:50]:  # Limit to avoid token limits
         content.append({
             "title": item.get("title", ""),
-            "summary": item.get("summary", ""),
+            # The opening of a summary carries its topics; the rest only adds prompt tokens
+            "summary": item.get("summary", "")[:_MAX_PROMPT_SUMMARY_CHARS],
         })
     
+    # Compact JSON: indentation roughly doubles the prompt size for no benefit to the model
     prompt = f"""
 Analyze the following HDC research items and extract the main topics/themes.
 
 Items:
-{json.dumps(content, indent=2)}
+{fastjson.dumps(content)}
 
 Return ONLY a JSON array of topic strings (2-5 words each).
 Focus on recurring themes and important research directions.
 Return 10-20 topics.
 """
     
+    # Imported lazily: the agents SDK is heavy, and keyword-only runs and chart rendering don't need it
+    from agents import Runner
+
     try:
         result = Runner.run_sync(agent, prompt)
         # Extract JSON from response
         text = result.final_output.strip()
         # Try to extract JSON array
-        json_match = re.search(r'\[.*?\]', text, re.DOTALL)
-        if json_match:
-            topics = json.loads(json_match.group(0))
+        topics = _find_json_array(text)
+        if topics is not None:
             return [str(t).strip() for t in topics if t]
         # Fallback: try parsing the whole response
         topics = json.loads(text)
@@ -112,32 +142,53 @@ Return 10-20 topics.
         return _extract_topics_keywords(items)
 
 
+def _build_matcher(patterns: List[str]) -> Optional["ahocorasick.Automaton"]:
+    """Build an Aho-Corasick automaton finding every pattern in one pass over a text.
+
+    Returns None when pyahocorasick is not installed or a pattern is empty (an automaton
+    cannot hold one); callers then fall back to one substring search per pattern.
+    """
+    if ahocorasick is None or not patterns or not all(patterns):
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+# Common HDC topics and the (lowercase) keywords that signal them, in priority order
+_TOPIC_KEYWORDS = {
+    "binding operations": ["binding", "bundling"],
+    "vector symbolic architectures": ["vsa", "vector symbolic"],
+    "neuromorphic computing": ["neuromorphic", "brain-inspired"],
+    "hardware acceleration": ["hardware", "fpga", "asic"],
+    "machine learning": ["learning", "classification", "neural"],
+    "permutation operations": ["permutation", "shift"],
+    "hypervector encoding": ["encoding", "hypervector"],
+    "similarity search": ["similarity", "search", "retrieval"],
+    "energy efficiency": ["energy", "efficient", "power"],
+    "scalability": ["scalable", "scale", "large-scale"],
+}
+_KEYWORD_MATCHER = _build_matcher([key for keys in _TOPIC_KEYWORDS.values() for key in keys])
+
+
 def _extract_topics_keywords(items: List[Dict[str, Any]]) -> List[str]:
     """Fallback keyword-based topic extraction."""
-    # Common HDC topics/keywords
-    keywords = {
-        "binding operations": ["binding", "bundling"],
-        "vector symbolic architectures": ["VSA", "vector symbolic"],
-        "neuromorphic computing": ["neuromorphic", "brain-inspired"],
-        "hardware acceleration": ["hardware", "FPGA", "ASIC"],
-        "machine learning": ["learning", "classification", "neural"],
-        "permutation operations": ["permutation", "shift"],
-        "hypervector encoding": ["encoding", "hypervector"],
-        "similarity search": ["similarity", "search", "retrieval"],
-        "energy efficiency": ["energy", "efficient", "power"],
-        "scalability": ["scalable", "scale", "large-scale"],
-    }
-    
     topic_counts = defaultdict(int)
-    all_text = " ".join([
-        item.get("title", "") + " " + item.get("summary", "")
-        for item in items
-    ]).lower()
-    
-    for topic, keys in keywords.items():
+    all_text = " ".join([_item_text(item) for item in items])
+
+    # One automaton pass counts every keyword; no keyword overlaps itself, so this equals str.count
+    key_counts = (
+        Counter(key for _, key in _KEYWORD_MATCHER.iter(all_text))
+        if _KEYWORD_MATCHER is not None else None
+    )
+    for topic, keys in _TOPIC_KEYWORDS.items():
+        # A topic is counted by its first keyword present in the text
         for key in keys:
-            if key.lower() in all_text:
-                topic_counts[topic] += all_text.count(key.lower())
+            count = key_counts[key] if key_counts is not None else all_text.count(key)
+            if count:
+                topic_counts[topic] += count
                 break
     
     # Return top topics
@@ -145,68 +196,71 @@ def _extract_topics_keywords(items: List[Dict[str, Any]]) -> List[str]:
     return [topic for topic, count in sorted_topics[:15] if count > 0]
 
 
+def _item_text(item: Dict[str, Any]) -> str:
+    """Lowercased title and summary of an item, the text topic mentions are matched in.
+
+    Uses the copy _get_items_by_time_period caches under "_text" when present, so items from
+    any other source work too.
+    """
+    text = item.get("_text")
+    if text is None:
+        text = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+    return text
+
+
+@lru_cache(maxsize=4096)
+def _period_key(date_str: str, period_type: str) -> str:
+    """Return the period a YYYY-MM-DD date falls in. Raises ValueError for malformed dates.
+
+    Memoized: items share a few hundred distinct dates, so each is parsed once per run.
+    """
+    date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    if period_type == "week":
+        # Use ISO week format: YYYY-WW
+        year, week, _ = date.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period_type == "month":
+        return date.strftime("%Y-%m")
+    if period_type == "year":
+        return date.strftime("%Y")
+    return date_str
+
+
 def _get_items_by_time_period(
     start_date: str,
     end_date: str,
     period_type: str = "week"
 ) -> Dict[str, List[Dict[str, Any]]]:
-    """Get items grouped by time period."""
-    conn = _get_db_connection()
-    try:
-        cursor = conn.execute("""
-            SELECT * FROM items
+    """Get items grouped by time period. Each item caches its lowercased text under "_text"."""
+    # Store's shared connection: already open and initialized by analyze_trends' _init_db()
+    with _conn_lock:
+        cursor = _get_conn().cursor()
+        cursor.row_factory = None  # plain tuples, unpacked by position below
+        # Only the columns trend analysis reads, all held in idx_items_date_cover
+        cursor.execute("""
+            SELECT first_seen_date, title, summary FROM items
             WHERE first_seen_date >= ? AND first_seen_date <= ?
             ORDER BY first_seen_date ASC
         """, (start_date, end_date))
         
-        items = [dict(row) for row in cursor.fetchall()]
-        
-        # Group by time period
+        # Group by time period as rows stream in
         period_items: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-        
-        for item in items:
-            date_str = item.get("first_seen_date", "")
+
+        for date_str, title, summary in cursor:
             if not date_str:
                 continue
-            
+            item = {"first_seen_date": date_str, "title": title, "summary": summary}
+            # Lowercased once here; keyword extraction and topic counting both match against it
+            item["_text"] = _item_text(item)
+
             try:
-                date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                
-                if period_type == "week":
-                    # Use ISO week format: YYYY-WW
-                    year, week, _ = date.isocalendar()
-                    period = f"{year}-W{week:02d}"
-                elif period_type == "month":
-                    period = date.strftime("%Y-%m")
-                elif period_type == "year":
-                    period = date.strftime("%Y")
-                else:
-                    period = date_str
-                
-                period_items[period].append(item)
+                period = _period_key(date_str, period_type)
             except ValueError:
                 logger.warning(f"Invalid date format: {date_str}")
                 continue
-        
+            period_items[period].append(item)
+
         return dict(period_items)
-    finally:
-        conn.close()
-
-
-def _calculate_topic_mentions(
-    items: List[Dict[str, Any]],
-    topic: str
-) -> int:
-    """Count how many items mention a topic."""
-    topic_lower = topic.lower()
-    count = 0
-    for item in items:
-        title = item.get("title", "").lower()
-        summary = item.get("summary", "").lower()
-        combined = title + " " + summary
-        if topic_lower in combined:
-            count += 1
-    return count
 
 
 def _build_time_series(
@@ -217,6 +271,9 @@ def _build_time_series(
     """Build time series data for each topic."""
     time_series: Dict[str, List[TrendDataPoint]] = {topic: [] for topic in topics}
     
+    topics_lower = [topic.lower() for topic in topics]
+    matcher = _build_matcher(topics_lower)
+
     # Sort periods chronologically
     sorted_periods = sorted(period_items.keys())
     
@@ -236,8 +293,19 @@ def _build_time_series(
             else:
                 date_str = f"{period}-01-01"
         
-        for topic in topics:
-            count = _calculate_topic_mentions(items, topic)
+        texts = [_item_text(item) for item in items]
+        # Number of items that mention each topic
+        if matcher is not None:
+            mentions = Counter()
+            for text in texts:
+                mentions.update({topic_lower for _, topic_lower in matcher.iter(text)})
+        else:
+            mentions = {
+                topic_lower: sum(topic_lower in text for text in texts)
+                for topic_lower in topics_lower
+            }
+        for topic, topic_lower in zip(topics, topics_lower):
+            count = mentions[topic_lower]
             time_series[topic].append(TrendDataPoint(
                 period=period,
                 date=date_str,
@@ -307,7 +375,6 @@ def analyze_trends(
     logger.info(f"Starting trend analysis (weeks_back={weeks_back}, period_type={period_type})")
     
     # Ensure database and items table exist (idempotent)
-    from .store import _init_db
     _init_db()
 
     # Calculate date range
@@ -333,8 +400,8 @@ def analyze_trends(
     if use_agent:
         logger.info("Extracting topics using agent...")
         from .digest import build_agent
-        agent = build_agent()
-        agent.instructions = SYSTEM_PROMPT
+        # build_agent() is shared/cached; clone rather than mutate it
+        agent = build_agent().clone(instructions=SYSTEM_PROMPT)
         topics = _extract_topics_from_items(all_items, agent)
     else:
         logger.info("Extracting topics using keywords...")
@@ -347,15 +414,17 @@ def analyze_trends(
     time_series = _build_time_series(period_items, topics, period_type)
     
     # Calculate total mentions and peak periods for each topic
-    topic_stats: List[Tuple[str, int, str, int]] = []
+    topic_stats: List[Tuple[str, int, TrendDataPoint]] = []
     for topic, points in time_series.items():
-        total = sum(p.count for p in points)
+        # Pull the counts out once; total and peak are then plain sum/max over ints
+        counts = [p.count for p in points]
+        total = sum(counts)
         if total == 0:
             continue
         
-        # Find peak period
-        peak_point = max(points, key=lambda p: p.count)
-        topic_stats.append((topic, total, peak_point.period, peak_point.count))
+        # Find peak period (the first one on ties)
+        peak_point = points[counts.index(max(counts))]
+        topic_stats.append((topic, total, peak_point))
     
     # Sort by total mentions and take top N
     topic_stats.sort(key=lambda x: x[1], reverse=True)
@@ -366,7 +435,7 @@ def analyze_trends(
     
     # Build TrendTopic objects
     top_topics = []
-    for topic, total, peak_period, peak_count in top_topics_data:
+    for topic, total, peak_point in top_topics_data:
         start_date_str, end_date_str = topic_periods.get(topic, (None, None))
         if start_date_str is None:
             # Find first non-zero point
@@ -374,23 +443,19 @@ def analyze_trends(
             first_active = next((p for p in points if p.count > 0), None)
             start_date_str = first_active.date if first_active else ""
         
-        # Find peak week date
-        peak_point = max(time_series[topic], key=lambda p: p.count)
-        peak_week = peak_point.date
-        
         top_topics.append(TrendTopic(
             name=topic,
             start_date=start_date_str,
             end_date=end_date_str,
             total_mentions=total,
-            peak_week=peak_week,
-            peak_count=peak_count
+            peak_week=peak_point.date,
+            peak_count=peak_point.count
         ))
     
     # Filter time series to only include top topics
     filtered_time_series = {
         topic: time_series[topic]
-        for topic, _, _, _ in top_topics_data
+        for topic, _, _ in top_topics_data
     }
     
     logger.info(f"Trend analysis complete: {len(top_topics)} top topics identified")
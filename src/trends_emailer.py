@@ -1,25 +1,66 @@
 """Email rendering and sending for weekly trends digest."""
-import base64
-import html
+import atexit
 import io
 import logging
-import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, cast
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import resend
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+import numpy as np
 
+# Memoized escape shared with the daily digest: topic names, weeks and dates repeat
+from .emailer import _email_settings, _escape_html, _send_via_resend
 from .trends import TrendAnalysis, TrendTopic, TrendDataPoint
 
+try:
+    from pybase64 import b64encode  # SIMD base64
+except ImportError:  # optional speedup; install with `pip install -e .[fast]`
+    from base64 import b64encode
 
-def _escape_html(text: str) -> str:
-    """Escape HTML entities to prevent XSS attacks."""
-    return html.escape(str(text))
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+# 12x8 in at 100 dpi is 1200x800 px, already wider than the email body it is shown in
+_CHART_DPI = 100
+_chart_figure: Optional[Tuple["Figure", "Axes"]] = None
+_DEFAULT_SUBPLOT_PARAMS: Dict[str, float] = {}  # filled from rcParams with the first figure
+
+
+# period_type -> (tick label format, major locator factory taking matplotlib.dates). Factories
+# rather than shared instances: a locator is bound to the axis it is set on.
+_PERIOD_AXIS = {
+    "week": ('%Y-%m', lambda mdates: mdates.WeekdayLocator(interval=4)),
+    "month": ('%Y-%m', lambda mdates: mdates.MonthLocator()),
+    "year": ('%Y', lambda mdates: mdates.YearLocator()),
+}
+_DEFAULT_PERIOD_AXIS = ('%Y-%m-%d', None)  # keeps matplotlib's automatic locator
+
+
+def _get_chart_axes() -> Tuple["Figure", "Axes"]:
+    """Return the shared chart figure and axes, cleared for a new plot (created on first use)."""
+    global _chart_figure
+    if _chart_figure is None:
+        # Imported lazily: pyplot's backend and font cache setup takes a few hundred ms that
+        # runs which never draw a chart shouldn't pay
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        import matplotlib.pyplot as plt
+
+        _DEFAULT_SUBPLOT_PARAMS.update(
+            (name, matplotlib.rcParams[f"figure.subplot.{name}"])
+            for name in ("left", "right", "bottom", "top", "wspace", "hspace")
+        )
+        # Building a Figure/Axes costs more than drawing a small chart; reuse one per process
+        _chart_figure = plt.subplots(figsize=(12, 8))
+        atexit.register(plt.close, _chart_figure[0])
+    else:
+        fig, ax = _chart_figure
+        ax.cla()
+        # Undo the previous tight_layout so the new layout is computed from the same start
+        fig.subplots_adjust(**_DEFAULT_SUBPLOT_PARAMS)
+    return _chart_figure
 
 
 def _generate_trend_chart(analysis: TrendAnalysis, output_path: Optional[Path] = None) -> str:
@@ -27,34 +68,40 @@ def _generate_trend_chart(analysis: TrendAnalysis, output_path: Optional[Path] =
     
     Args:
         analysis: TrendAnalysis object with time series data
-        output_path: Optional path to save chart image
+        output_path: Optional path to save chart image (written as PNG)
     
     Returns:
         Base64-encoded PNG image string for embedding in email
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _get_chart_axes()
+    import matplotlib.pyplot as plt  # already loaded by _get_chart_axes
+    import matplotlib.dates as mdates
     
     # Prepare data for plotting
-    all_dates = set()
     topic_data = {}
     
     for topic, points in analysis.time_series.items():
         if not points:
             continue
         
-        dates = []
-        counts = []
-        
-        for point in points:
-            try:
-                date_obj = datetime.strptime(point.date, "%Y-%m-%d").date()
-                dates.append(date_obj)
-                counts.append(point.count)
-                all_dates.add(date_obj)
-            except ValueError:
-                continue
+        counts = np.fromiter((point.count for point in points), dtype=np.int64, count=len(points))
+        try:
+            # Parse the whole series in one C-level conversion
+            dates = np.array([point.date for point in points], dtype="datetime64[D]")
+        except ValueError:
+            # A malformed date: parse point by point and skip the bad ones
+            parsed = []
+            for point in points:
+                try:
+                    parsed.append(datetime.strptime(point.date, "%Y-%m-%d").date())
+                except ValueError:
+                    parsed.append(None)
+            dates = np.array(parsed, dtype="datetime64[D]")  # None becomes NaT
+        valid = ~np.isnat(dates)  # empty strings also convert to NaT
+        if not valid.all():
+            dates, counts = dates[valid], counts[valid]
         
-        if dates:
+        if len(dates):
             topic_data[topic] = (dates, counts)
     
     if not topic_data:
@@ -68,16 +115,15 @@ def _generate_trend_chart(analysis: TrendAnalysis, output_path: Optional[Path] =
     else:
         # Plot each topic as a line
         colors = plt.cm.tab20(range(len(topic_data)))
+        topic_by_name = {t.name: t for t in analysis.top_topics}
         for (topic, (dates, counts)), color in zip(topic_data.items(), colors):
             # Handle topic start/stop - only plot when active
-            topic_obj = next((t for t in analysis.top_topics if t.name == topic), None)
+            topic_obj = topic_by_name.get(topic)
             if topic_obj and topic_obj.end_date:
                 # Topic has ended - only plot up to end date
-                end_date = datetime.strptime(topic_obj.end_date, "%Y-%m-%d").date()
-                filtered_dates = [d for d in dates if d <= end_date]
-                filtered_counts = [c for d, c in zip(dates, counts) if d <= end_date]
-                if filtered_dates:
-                    ax.plot(filtered_dates, filtered_counts, label=topic, 
+                active = dates <= np.datetime64(topic_obj.end_date, "D")
+                if active.any():
+                    ax.plot(dates[active], counts[active], label=topic, 
                            linewidth=2, color=color, marker='o', markersize=3)
             else:
                 # Active topic - plot all data
@@ -85,41 +131,76 @@ def _generate_trend_chart(analysis: TrendAnalysis, output_path: Optional[Path] =
                        linewidth=2, color=color, marker='o', markersize=3)
         
         # Format x-axis based on period type
-        if analysis.period_type == "week":
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=4))
-        elif analysis.period_type == "month":
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-            ax.xaxis.set_major_locator(mdates.MonthLocator())
-        elif analysis.period_type == "year":
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
-            ax.xaxis.set_major_locator(mdates.YearLocator())
-        else:
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
+        date_format, make_locator = _PERIOD_AXIS.get(analysis.period_type, _DEFAULT_PERIOD_AXIS)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+        if make_locator is not None:
+            ax.xaxis.set_major_locator(make_locator(mdates))
         
-        plt.xticks(rotation=45, ha='right')
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
         ax.set_xlabel('Time')
         ax.set_ylabel('Number of Mentions')
         ax.set_title('HDC Research Trends Over Time', fontsize=16, fontweight='bold')
         ax.grid(True, alpha=0.3)
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
     
-    plt.tight_layout()
+    # tight_layout already makes room for the outside legend, so savefig can skip the extra
+    # draw that bbox_inches='tight' spends measuring the figure
+    fig.tight_layout()
+    
+    # Render the PNG once; the email and the optional file share the same bytes
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=_CHART_DPI)
+    png_bytes = buffer.getvalue()
     
-    # Save to buffer or file
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
+        Path(output_path).write_bytes(png_bytes)
         logger.info(f"Chart saved to {output_path}")
     
-    # Also save to buffer for email
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-    buffer.seek(0)
-    image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-    buffer.close()
-    plt.close()
-    
-    return image_base64
+    return b64encode(png_bytes).decode('ascii')
+
+
+# Static fragments of the trends email, built once at import
+_CELL_STYLE = "border: 1px solid #ccc; padding: 6px 8px;"
+_TOPIC_TABLE_HEAD = (
+    "<h2>Top Trends</h2>"
+    '<table style="border-collapse: collapse; width: 100%; margin-bottom: 1rem;">'
+    "<thead><tr style=\"background: #eee;\">"
+    f"<th style=\"{_CELL_STYLE} text-align: left;\">Topic</th>"
+    f"<th style=\"{_CELL_STYLE} text-align: right;\">Total</th>"
+    f"<th style=\"{_CELL_STYLE} text-align: right;\">Peak</th>"
+    f"<th style=\"{_CELL_STYLE} text-align: left;\">Peak week</th>"
+    f"<th style=\"{_CELL_STYLE} text-align: left;\">Status</th>"
+    "</tr></thead><tbody>"
+)
+# One table row; the cell styles are baked in and only the per-topic fields are formatted
+_TOPIC_ROW_TEMPLATE = (
+    "<tr>"
+    f"<td style=\"{_CELL_STYLE}\">{{name}}</td>"
+    f"<td style=\"{_CELL_STYLE} text-align: right;\">{{total}}</td>"
+    f"<td style=\"{_CELL_STYLE} text-align: right;\">{{peak}}</td>"
+    f"<td style=\"{_CELL_STYLE}\">{{peak_week}}</td>"
+    f"<td style=\"{_CELL_STYLE}\">{{status}}</td>"
+    "</tr>"
+)
+_TOPIC_TABLE_TAIL = "</tbody></table><hr/>"
+_CHART_IMG_HEAD = '<h2>Trend Chart</h2><img src="data:image/png;base64,'
+_CHART_IMG_TAIL = '" alt="Trend Chart" style="max-width: 100%; height: auto;" /><hr/>'
+_NO_TREND_DATA_HTML = (
+    "<p><em>No trend data yet. The weekly digest reads from the same database as the daily digest. "
+    "If this is the first run or the database was empty, run the daily digest to populate it; "
+    "topics will appear once items have been collected.</em></p>"
+)
+
+
+def _topic_row_fields(topic: TrendTopic) -> Dict[str, object]:
+    """Escaped template fields for one row of the top trends table."""
+    return {
+        "name": _escape_html(topic.name),
+        "total": topic.total_mentions,
+        "peak": topic.peak_count,
+        "peak_week": _escape_html(topic.peak_week),
+        "status": "Active" if topic.end_date is None else f"Ended: {_escape_html(topic.end_date)}",
+    }
 
 
 def render_trends_email(analysis: TrendAnalysis, chart_base64: Optional[str] = None) -> str:
@@ -132,72 +213,49 @@ def render_trends_email(analysis: TrendAnalysis, chart_base64: Optional[str] = N
     Returns:
         HTML email content string
     """
-    html_content = [
-        f"<h1>HDC Weekly Trends Digest</h1>",
-        f"<p><b>Analysis Date:</b> {_escape_html(analysis.analysis_date)}</p>",
-        f"<p><b>Period Type:</b> {_escape_html(analysis.period_type)}</p>",
-        "<hr/>"
-    ]
-    
     # Top trends table
+    topic_table = ""
     if analysis.top_topics:
-        html_content.append("<h2>Top Trends</h2>")
-        html_content.append(
-            '<table style="border-collapse: collapse; width: 100%; margin-bottom: 1rem;">'
-        )
-        html_content.append(
-            "<thead><tr style=\"background: #eee;\">"
-            "<th style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: left;\">Topic</th>"
-            "<th style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: right;\">Total</th>"
-            "<th style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: right;\">Peak</th>"
-            "<th style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: left;\">Peak week</th>"
-            "<th style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: left;\">Status</th>"
-            "</tr></thead><tbody>"
-        )
-        for topic in analysis.top_topics:
-            status = "Active" if topic.end_date is None else f"Ended: {_escape_html(topic.end_date)}"
-            html_content.append(
-                f"<tr>"
-                f"<td style=\"border: 1px solid #ccc; padding: 6px 8px;\">{_escape_html(topic.name)}</td>"
-                f"<td style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: right;\">{topic.total_mentions}</td>"
-                f"<td style=\"border: 1px solid #ccc; padding: 6px 8px; text-align: right;\">{topic.peak_count}</td>"
-                f"<td style=\"border: 1px solid #ccc; padding: 6px 8px;\">{_escape_html(topic.peak_week)}</td>"
-                f"<td style=\"border: 1px solid #ccc; padding: 6px 8px;\">{status}</td>"
-                f"</tr>"
-            )
-        html_content.append("</tbody></table>")
-        html_content.append("<hr/>")
-    
-    # Trend chart
+        row_fields = [_topic_row_fields(topic) for topic in analysis.top_topics]
+        rows = "".join([_TOPIC_ROW_TEMPLATE.format_map(fields) for fields in row_fields])
+        topic_table = f"{_TOPIC_TABLE_HEAD}{rows}{_TOPIC_TABLE_TAIL}"
+    
+    # Trend chart: the base64 payload is copied once, straight into the final string, rather
+    # than first into an <img> fragment of its own
     if chart_base64:
-        html_content.append("<h2>Trend Chart</h2>")
-        html_content.append(
-            f'<img src="data:image/png;base64,{chart_base64}" '
-            f'alt="Trend Chart" style="max-width: 100%; height: auto;" />'
-        )
-        html_content.append("<hr/>")
+        chart_head, chart_tail = _CHART_IMG_HEAD, _CHART_IMG_TAIL
+    else:
+        chart_head = chart_tail = chart_base64 = ""
     
     # Summary statistics
     total_topics = len(analysis.top_topics)
     active_topics = sum(1 for t in analysis.top_topics if t.end_date is None)
-    html_content.append("<h2>Summary</h2>")
-    html_content.append(f"<p>Total topics tracked: {total_topics}</p>")
-    html_content.append(f"<p>Active topics: {active_topics}</p>")
-    html_content.append(f"<p>Inactive topics: {total_topics - active_topics}</p>")
-    if total_topics == 0:
-        html_content.append(
-            "<p><em>No trend data yet. The weekly digest reads from the same database as the daily digest. "
-            "If this is the first run or the database was empty, run the daily digest to populate it; "
-            "topics will appear once items have been collected.</em></p>"
-        )
 
-    return "".join(html_content)
+    return (
+        f"<h1>HDC Weekly Trends Digest</h1>"
+        f"<p><b>Analysis Date:</b> {_escape_html(analysis.analysis_date)}</p>"
+        f"<p><b>Period Type:</b> {_escape_html(analysis.period_type)}</p>"
+        f"<hr/>{topic_table}{chart_head}{chart_base64}{chart_tail}"
+        f"<h2>Summary</h2>"
+        f"<p>Total topics tracked: {total_topics}</p>"
+        f"<p>Active topics: {active_topics}</p>"
+        f"<p>Inactive topics: {total_topics - active_topics}</p>"
+        f"{_NO_TREND_DATA_HTML if total_topics == 0 else ''}"
+    )
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def build_trends_email(analysis: TrendAnalysis) -> str:
+    """Generate the trend chart and render the full email HTML (the one chart render per run)."""
+    logger.info("Generating trend chart...")
+    chart_base64 = _generate_trend_chart(analysis)
+    logger.info("Chart generated successfully")
+    return render_trends_email(analysis, chart_base64)
+
+
 def send_trends_email(analysis: TrendAnalysis, dry_run: bool = False) -> None:
     """Generate chart, render email, and send weekly trends digest.
     
@@ -205,14 +263,7 @@ def send_trends_email(analysis: TrendAnalysis, dry_run: bool = False) -> None:
         analysis: TrendAnalysis object
         dry_run: If True, print email instead of sending
     """
-    
-    # Generate chart
-    logger.info("Generating trend chart...")
-    chart_base64 = _generate_trend_chart(analysis)
-    logger.info("Chart generated successfully")
-    
-    # Render email
-    html_content = render_trends_email(analysis, chart_base64)
+    html_content = build_trends_email(analysis)
     
     if dry_run:
         # Dry run: print email content
@@ -224,9 +275,7 @@ def send_trends_email(analysis: TrendAnalysis, dry_run: bool = False) -> None:
         return
     
     # Validate required environment variables
-    api_key = os.environ.get("RESEND_API_KEY")
-    email_from = os.environ.get("EMAIL_FROM")
-    email_to = os.environ.get("EMAIL_TO")
+    api_key, email_from, email_to = _email_settings()
     
     if not api_key:
         raise ValueError("RESEND_API_KEY environment variable is required")
@@ -235,8 +284,6 @@ def send_trends_email(analysis: TrendAnalysis, dry_run: bool = False) -> None:
     if not email_to:
         raise ValueError("EMAIL_TO environment variable is required")
     
-    resend.api_key = api_key
-    
     # Construct email parameters
     date_str = analysis.analysis_date
     params = {
@@ -246,6 +293,5 @@ def send_trends_email(analysis: TrendAnalysis, dry_run: bool = False) -> None:
         "html": html_content,
     }
     
-    # Type cast to satisfy type checker
-    resend.Emails.send(cast(resend.Emails.SendParams, params))
+    _send_via_resend(api_key, params)
     logger.info("Trends email sent successfully")
@@ -5,7 +5,7 @@ import sys
 import webbrowser
 from pathlib import Path
 from .trends import analyze_trends
-from .trends_emailer import send_trends_email, render_trends_email, _generate_trend_chart
+from .trends_emailer import build_trends_email, send_trends_email
 from .emailer import send_error_email
 
 # Configure logging
@@ -16,6 +16,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Browser page wrapped around the email HTML by --preview; {body} is the only slot
+_PREVIEW_TEMPLATE = (
+    '<!DOCTYPE html><html><head><meta charset="UTF-8">'
+    '<meta name="viewport" content="width=device-width, initial-scale=1">'
+    '<title>HDC Weekly Trends – Preview</title>'
+    '</head><body style="font-family: system-ui, sans-serif; max-width: 720px; margin: 0 auto; padding: 1rem;">'
+    "{body}</body></html>"
+)
+
 
 def main():
     """Run trends analysis and send email."""
@@ -70,19 +79,10 @@ def main():
         logger.info(f"Trends analysis complete: {len(analysis.top_topics)} topics identified")
         
         if args.dry_run or args.preview:
-            chart_base64 = _generate_trend_chart(analysis)
-            html_body = render_trends_email(analysis, chart_base64)
+            html_body = build_trends_email(analysis)
             if args.preview:
                 preview_path = Path("trends-preview.html")
-                full_html = (
-                    '<!DOCTYPE html><html><head><meta charset="UTF-8">'
-                    '<meta name="viewport" content="width=device-width, initial-scale=1">'
-                    '<title>HDC Weekly Trends – Preview</title>'
-                    '</head><body style="font-family: system-ui, sans-serif; max-width: 720px; margin: 0 auto; padding: 1rem;">'
-                    + html_body
-                    + "</body></html>"
-                )
-                preview_path.write_text(full_html, encoding="utf-8")
+                preview_path.write_text(_PREVIEW_TEMPLATE.format(body=html_body), encoding="utf-8")
                 abs_path = preview_path.resolve()
                 logger.info("Wrote %s", abs_path)
                 webbrowser.open(abs_path.as_uri())
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from src import digest
+from src.digest import SECTION_QUERIES, _make_date_filter, _parse_date
+
+
+def test_parse_date_iso():
+    assert _parse_date("2024-01-05") == datetime(2024, 1, 5, tzinfo=timezone.utc)
+    assert _parse_date(" 2024-01-05T10:00:00Z ") == datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+
+def test_parse_date_not_zero_padded():
+    assert _parse_date("2024-1-5") == datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+
+def test_parse_date_invalid():
+    assert _parse_date(None) is None
+    assert _parse_date("") is None
+    assert _parse_date("not a date") is None
+
+
+def test_date_filter_drops_old_unpadded_date():
+    is_recent = _make_date_filter(days_back=7)
+    old = datetime.now(timezone.utc) - timedelta(days=400)
+    assert not is_recent(f"{old.year}-{old.month}-{old.day}")
+    assert is_recent(None)  # unknown dates are kept
+
+
+def _section_prompt(monkeypatch, name, query):
+    prompts = []
+
+    async def fake_run(agent, prompt):
+        prompts.append(prompt)
+        return {"items": []}
+
+    monkeypatch.setattr(digest, "_cached_run", fake_run)
+    asyncio.run(digest._run_section_async(None, name, query, days_back=7, max_items=5))
+    return prompts[0]
+
+
+def test_section_prompt_default_query(monkeypatch):
+    prompt = _section_prompt(monkeypatch, "News", SECTION_QUERIES["News"])
+    assert SECTION_QUERIES["News"] in prompt
+    assert "Max 5 items" in prompt
+
+
+def test_section_prompt_custom_query(monkeypatch):
+    prompt = _section_prompt(monkeypatch, "News", "custom query")
+    assert "custom query" in prompt
+    assert SECTION_QUERIES["News"] not in prompt
+
+
+def test_section_prompt_query_with_braces(monkeypatch):
+    prompt = _section_prompt(monkeypatch, "Other", "x {y} z")
+    assert "x {y} z" in prompt
+    assert "SECTION: Other" in prompt
@@ -0,0 +1,24 @@
+from src.trends import _build_time_series, _extract_topics_keywords
+
+
+def _item(title, summary, first_seen_date="2024-01-01"):
+    return {"title": title, "summary": summary, "first_seen_date": first_seen_date}
+
+
+def test_extract_topics_keywords_plain_items():
+    items = [
+        _item("Binding in VSA", "Binding and bundling of hypervectors."),
+        _item("FPGA accelerator", "Hardware for hyperdimensional computing."),
+    ]
+    topics = _extract_topics_keywords(items)
+    assert "binding operations" in topics
+    assert "hardware acceleration" in topics
+
+
+def test_build_time_series_plain_items():
+    period_items = {
+        "2024-W01": [_item("Binding operations", "x"), _item("Other", "no match")],
+        "2024-W02": [_item("Nothing", "here", "2024-01-08")],
+    }
+    series = _build_time_series(period_items, ["Binding Operations"], "week")
+    assert [point.count for point in series["Binding Operations"]] == [1, 0]